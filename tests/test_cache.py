@@ -0,0 +1,152 @@
+"""Tests for the on-disk API response cache."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from volt.sdk import cache
+from volt.sdk.cache import NOT_MODIFIED, cached
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+class FakeClient:
+    """Counts calls and serves whatever payload or error is queued."""
+
+    def __init__(self, api_key="key"):
+        self.config = SimpleNamespace(base_url="https://api.example", api_key=api_key)
+        self.calls = []
+        self.payload = {"items": [1]}
+        self.error = None
+        self.modified = True
+
+    def _respond(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return self.payload
+
+    @cached(ttl=60)
+    def fresh(self, kind="all"):
+        return self._respond(kind=kind)
+
+    @cached(ttl=0)
+    def expired(self):
+        return self._respond()
+
+    @cached(ttl=0, revalidate=True)
+    def revalidated(self, etag=None):
+        self._respond(etag=etag)
+        if not self.modified:
+            return NOT_MODIFIED
+        return self.payload, '"v1"'
+
+
+def test_payload_is_served_from_disk_within_ttl():
+    client = FakeClient()
+    assert client.fresh() == {"items": [1]}
+    client.payload = {"items": [2]}
+    assert client.fresh() == {"items": [1]}
+    assert len(client.calls) == 1
+
+
+def test_entries_are_keyed_by_arguments_and_api_key():
+    client = FakeClient()
+    client.fresh("a")
+    client.fresh("b")
+    FakeClient(api_key="other").fresh("a")
+    assert len(client.calls) == 2
+
+
+def test_expired_entry_is_refetched():
+    client = FakeClient()
+    client.expired()
+    client.payload = {"items": [2]}
+    assert client.expired() == {"items": [2]}
+    assert len(client.calls) == 2
+
+
+def test_stale_entry_is_returned_when_the_request_fails():
+    client = FakeClient()
+    client.expired()
+    client.error = httpx.ConnectError("offline")
+    assert client.expired() == {"items": [1]}
+
+
+def _status_error(status_code):
+    request = httpx.Request("GET", "https://api.example/items")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(str(status_code), request=request, response=response)
+
+
+def test_stale_entry_is_returned_on_server_error():
+    client = FakeClient()
+    client.expired()
+    client.error = _status_error(503)
+    assert client.expired() == {"items": [1]}
+
+
+@pytest.mark.parametrize("status_code", [401, 403, 404])
+def test_client_error_bypasses_stale_entry(status_code):
+    client = FakeClient()
+    client.expired()
+    client.error = _status_error(status_code)
+    with pytest.raises(httpx.HTTPStatusError):
+        client.expired()
+
+
+def test_request_error_without_entry_propagates():
+    client = FakeClient()
+    client.error = httpx.ConnectError("offline")
+    with pytest.raises(httpx.ConnectError):
+        client.expired()
+
+
+def test_revalidation_sends_cached_etag_and_keeps_payload_on_304():
+    client = FakeClient()
+    assert client.revalidated() == {"items": [1]}
+    assert client.calls[-1] == {"etag": None}
+
+    client.modified = False
+    client.payload = {"items": [2]}
+    assert client.revalidated() == {"items": [1]}
+    assert client.calls[-1] == {"etag": '"v1"'}
+
+    # The 304 keeps the etag for the next revalidation
+    client.revalidated()
+    assert client.calls[-1] == {"etag": '"v1"'}
+
+
+def test_revalidation_replaces_payload_when_modified():
+    client = FakeClient()
+    client.revalidated()
+    client.payload = {"items": [2]}
+    assert client.revalidated() == {"items": [2]}
+
+
+def test_invalidate_drops_only_the_matching_entry():
+    client = FakeClient()
+    client.fresh("a")
+    client.fresh("b")
+    FakeClient.fresh.invalidate(client, "a")
+    client.fresh("a")
+    client.fresh("b")
+    assert [call["kind"] for call in client.calls] == ["a", "b", "a"]
+
+
+def test_invalidate_without_entry_is_a_no_op():
+    FakeClient.fresh.invalidate(FakeClient(), "missing")
+
+
+def test_unreadable_entry_is_ignored(cache_dir):
+    client = FakeClient()
+    client.fresh()
+    for path in cache_dir.iterdir():
+        path.write_text("not json")
+    client.fresh()
+    assert len(client.calls) == 2
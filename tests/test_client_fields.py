@@ -0,0 +1,54 @@
+"""Tests for mapping API records onto client dataclass fields."""
+
+import random
+
+import pytest
+
+from volt.sdk.client import (
+    _MACHINE_FIELDS,
+    _POD_FIELDS,
+    _SSH_KEY_FIELDS,
+    _TEMPLATE_FIELDS,
+    _pick_fields,
+    _pick_many,
+)
+
+ALL_FIELDS = [_POD_FIELDS, _TEMPLATE_FIELDS, _SSH_KEY_FIELDS, _MACHINE_FIELDS]
+
+
+def _aliases(fields):
+    return sorted({key for _, keys, _ in fields for key in keys})
+
+
+def test_pick_fields_prefers_first_alias_and_defaults():
+    values = _pick_fields({"gpuType": "A100", "gpu_type": "H100", "hourlyPrice": "1.5"}, _MACHINE_FIELDS)
+    assert values["gpu_type"] == "A100"
+    assert values["hourly_price"] == 1.5
+    assert values["gpu_count"] == 1
+    assert values["available"] is True
+
+
+def test_pick_many_empty():
+    assert list(_pick_many([], _POD_FIELDS)) == []
+
+
+def test_pick_many_later_record_with_preferred_alias():
+    records = [{"gpu_type": "A100", "id": "a"}, {"gpuType": "H100", "gpu_type": "B200", "id": "b"}]
+    assert [values["gpu_type"] for values in _pick_many(records, _MACHINE_FIELDS)] == ["A100", "H100"]
+
+
+def test_pick_many_later_record_missing_resolved_key():
+    records = [{"id": "a", "gpuType": "A100"}, {"id": "b"}]
+    assert list(_pick_many(records, _MACHINE_FIELDS)) == [_pick_fields(r, _MACHINE_FIELDS) for r in records]
+
+
+@pytest.mark.parametrize("fields", ALL_FIELDS)
+def test_pick_many_matches_pick_fields_on_random_records(fields):
+    rng = random.Random(0)
+    keys = _aliases(fields)
+    for _ in range(500):
+        records = [
+            {key: rng.randint(0, 9) for key in keys if rng.random() < 0.5}
+            for _ in range(rng.randint(1, 6))
+        ]
+        assert list(_pick_many(records, fields)) == [_pick_fields(r, fields) for r in records]
@@ -0,0 +1,55 @@
+"""Tests for human-readable pod and executor IDs."""
+
+import hashlib
+import uuid
+
+import pytest
+
+from volt.sdk import utils
+from volt.sdk.utils import ADJECTIVES, NOUNS, generate_huid, generate_huids
+
+
+def _reference_huid(id_str):
+    """The original hex-slicing implementation HUIDs must stay compatible with."""
+    if not id_str:
+        return "invalid"
+    digest = hashlib.md5(id_str.encode()).hexdigest()
+    adj = ADJECTIVES[int(digest[:4], 16) % len(ADJECTIVES)]
+    noun = NOUNS[int(digest[4:8], 16) % len(NOUNS)]
+    return f"{adj}-{noun}-{digest[-2:]}"
+
+
+def _ids(count):
+    return [str(uuid.UUID(int=i * 7919 + 1)) for i in range(count)] + ["", "abc"]
+
+
+def test_generate_huid_known_values():
+    assert generate_huid("00000000-0000-0000-0000-000000000000") == "brave-wolf-33"
+    assert generate_huid("abc") == "cosmic-eagle-72"
+    assert generate_huid("") == "invalid"
+
+
+def test_generate_huid_matches_reference():
+    for id_str in _ids(5000):
+        assert generate_huid(id_str) == _reference_huid(id_str)
+
+
+@pytest.mark.parametrize("count", [0, 1, utils._NUMPY_HUID_MIN - 1, utils._NUMPY_HUID_MIN, 2000])
+def test_generate_huids_matches_generate_huid(count):
+    ids = _ids(count)
+    assert generate_huids(ids) == [generate_huid(id_str) for id_str in ids]
+
+
+def test_generate_huids_without_numpy(monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_numpy(name, *args, **kwargs):
+        if name == "numpy":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_numpy)
+    ids = _ids(utils._NUMPY_HUID_MIN * 2)
+    assert generate_huids(ids) == [_reference_huid(id_str) for id_str in ids]
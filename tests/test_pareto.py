@@ -0,0 +1,51 @@
+"""Tests for the executor Pareto frontier."""
+
+import random
+
+import pytest
+
+pytest.importorskip("lium")
+np = pytest.importorskip("numpy")
+
+from volt.cli.utils import _PRIORITY_METRICS, _pareto_flags_numpy, dominates  # noqa: E402
+
+METRICS = (
+    "price_per_gpu_hour", "vram_gb", "ram_gb", "disk_gb", "pcie_speed", "memory_bandwidth",
+    "tflops", "net_up", "net_down", "location_score", "total_bandwidth",
+)
+
+
+def _pairwise_flags(metrics_list):
+    return [
+        not any(i != j and dominates(other, metrics) for j, other in enumerate(metrics_list))
+        for i, metrics in enumerate(metrics_list)
+    ]
+
+
+def _random_metrics(rng):
+    # Few distinct values so that ties and equal prices are common
+    metrics = {name: float(rng.choice([0, 1, 2, 4, 8])) for name in METRICS}
+    metrics["price_per_gpu_hour"] = rng.choice([0.5, 0.505, 1.0, 2.0, float("inf")])
+    metrics["location_score"] = float(rng.random() < 0.5)
+    for name in _PRIORITY_METRICS:
+        if rng.random() < 0.3:
+            metrics[name] = 0
+    return metrics
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_numpy_flags_match_pairwise_dominates(seed):
+    rng = random.Random(seed)
+    metrics_list = [_random_metrics(rng) for _ in range(rng.randint(2, 300))]
+    assert _pareto_flags_numpy(metrics_list) == _pairwise_flags(metrics_list)
+
+
+def test_numpy_flags_span_several_blocks():
+    rng = random.Random(99)
+    metrics_list = [_random_metrics(rng) for _ in range(400)]
+    assert _pareto_flags_numpy(metrics_list) == _pairwise_flags(metrics_list)
+
+
+def test_identical_executors_are_all_on_the_frontier():
+    metrics = _random_metrics(random.Random(1))
+    assert _pareto_flags_numpy([dict(metrics) for _ in range(5)]) == [True] * 5
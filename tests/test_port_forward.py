@@ -0,0 +1,168 @@
+"""Tests for the selector-based port forwarder."""
+
+import importlib.util
+import socket
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).parents[1] / "volt" / "cli" / "port_forward" / "command.py"
+
+
+@pytest.fixture(scope="module")
+def pf():
+    """Load the port-forward module with a stand-in for the lium CLI helpers it imports."""
+    ui = types.SimpleNamespace(dim=lambda *a, **k: None, debug=lambda *a, **k: None)
+    utils = types.ModuleType("lium.cli.utils")
+    utils.handle_errors = lambda func: func
+    utils.parse_targets = utils.get_lium = None
+    cli = types.ModuleType("lium.cli")
+    cli.ui = ui
+    cli.utils = utils
+    lium = types.ModuleType("lium")
+    lium.cli = cli
+    lium.__path__ = []
+
+    fakes = {"lium": lium, "lium.cli": cli, "lium.cli.utils": utils}
+    saved = {name: sys.modules.get(name) for name in fakes}
+    sys.modules.update(fakes)
+    try:
+        spec = importlib.util.spec_from_file_location("port_forward_command", MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        for name, original in saved.items():
+            if original is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = original
+    return module
+
+
+@pytest.fixture(params=["splice", "buffer"])
+def forwarder(request, pf, monkeypatch):
+    """Yield (forwarder, remote listener, local address) with the event loop running."""
+    if request.param == "splice":
+        if not pf.SPLICE:
+            pytest.skip("splice(2) not available")
+    else:
+        monkeypatch.setattr(pf, "SPLICE", False)
+
+    remote = socket.create_server(("127.0.0.1", 0))
+    server = socket.create_server(("127.0.0.1", 0))
+    fwd = pf.Forwarder(server, *remote.getsockname())
+
+    stop = threading.Event()
+    errors = []
+
+    def loop():
+        try:
+            while not stop.is_set():
+                fwd.poll(0.02)
+        except Exception as e:  # surfaced by the test below
+            errors.append(e)
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    yield fwd, remote, server.getsockname()
+    stop.set()
+    thread.join(5)
+    fwd.close()
+    server.close()
+    remote.close()
+    assert not errors
+
+
+def _recv_all(sock):
+    chunks = []
+    while True:
+        data = sock.recv(65536)
+        if not data:
+            return b"".join(chunks)
+        chunks.append(data)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_forwards_both_directions_and_half_close(forwarder):
+    fwd, remote, address = forwarder
+    request = b"ping " * 50_000
+    client = socket.create_connection(address, timeout=5)
+    upstream, _ = remote.accept()
+    upstream.settimeout(5)
+
+    client.sendall(request)
+    client.shutdown(socket.SHUT_WR)
+
+    # The remote sees the whole request followed by EOF, then still answers
+    assert _recv_all(upstream) == request
+    upstream.sendall(b"pong")
+    upstream.close()
+
+    assert _recv_all(client) == b"pong"
+    client.close()
+
+    # Both directions are done, so the pair is dropped
+    assert _wait_for(lambda: not fwd.peer)
+
+
+def test_remote_half_close_keeps_client_direction_open(forwarder):
+    fwd, remote, address = forwarder
+    client = socket.create_connection(address, timeout=5)
+    upstream, _ = remote.accept()
+    upstream.settimeout(5)
+
+    upstream.sendall(b"banner")
+    upstream.shutdown(socket.SHUT_WR)
+    assert _recv_all(client) == b"banner"
+
+    client.sendall(b"late data")
+    client.shutdown(socket.SHUT_WR)
+    assert _recv_all(upstream) == b"late data"
+    client.close()
+    upstream.close()
+    assert _wait_for(lambda: not fwd.peer)
+
+
+def test_backpressure_bounds_queued_bytes(pf, forwarder):
+    fwd, remote, address = forwarder
+    client = socket.create_connection(address, timeout=5)
+    upstream, _ = remote.accept()
+
+    # The remote never reads: keep writing until the client's send buffer is full
+    client.setblocking(False)
+    sent = 0
+    chunk = b"x" * 65536
+    stalled = 0
+    while stalled < 20:
+        try:
+            sent += client.send(chunk)
+            stalled = 0
+        except BlockingIOError:
+            stalled += 1
+            time.sleep(0.02)
+
+    limit = max(
+        [pf.HIGH_WATER] + [capacity for _, _, capacity in fwd.pipes.values()]
+    ) + pf.BUFFER_SIZE
+    assert sent > 2 * limit
+    assert all(fwd._queued(sock) <= limit for sock in list(fwd.peer))
+
+    # Once the remote reads, everything arrives in order
+    upstream.settimeout(5)
+    client.setblocking(True)
+    client.shutdown(socket.SHUT_WR)
+    assert _recv_all(upstream) == b"x" * sent
+    client.close()
+    upstream.close()
@@ -0,0 +1,36 @@
+"""Tests for up command input validation."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# Loaded by path: the volt.cli.up package imports the lium CLI, which this
+# module does not need
+_spec = importlib.util.spec_from_file_location(
+    "up_validation", Path(__file__).parents[1] / "volt" / "cli" / "up" / "validation.py"
+)
+validation = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validation)
+parse_internal_ports = validation.parse_internal_ports
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("22", [22]),
+    ("22,8000,8080", [22, 8000, 8080]),
+    ("8000", [22, 8000]),
+    ("8000,8080", [22, 8000, 8080]),
+    (" 8000 , 8080 ", [22, 8000, 8080]),
+    ("8000,22", [8000, 22]),
+    ("8000,8000,22,8080,8000", [8000, 22, 8080]),
+    ("22,22", [22]),
+])
+def test_parse_internal_ports(spec, expected):
+    assert parse_internal_ports(spec) == (expected, None)
+
+
+@pytest.mark.parametrize("spec", ["", ",", "22,", ",22", "22,,80", "http", "22;80", "22 80", "-1", "+80", "1_000", "8.5"])
+def test_parse_internal_ports_rejects_malformed_specs(spec):
+    ports, error = parse_internal_ports(spec)
+    assert ports == []
+    assert "Invalid port format" in error
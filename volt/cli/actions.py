@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class ActionResult:
     ok: bool
     data: dict
     error: str = ""
 
 
+# Shared result for successful actions with no data; callers must not mutate its data
+ActionResult.OK_EMPTY = ActionResult(ok=True, data={})
+
+
 __all__ = ["ActionResult"]
@@ -0,0 +1,34 @@
+"""Short-lived in-process cache for backup configuration lookups."""
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
+
+# Seconds a cached backup config stays valid
+TTL = 30.0
+
+enabled = True
+
+_configs: Dict[str, Tuple[float, Any]] = {}
+
+
+def get_backup_config(lium: "Lium", pod: "PodInfo"):
+    """Return backup config for a pod, reusing a recent lookup if available."""
+    if not enabled:
+        return lium.backup_config(pod)
+
+    now = time.monotonic()
+    cached = _configs.get(pod.id)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    backup_config = lium.backup_config(pod)
+    _configs[pod.id] = (now + TTL, backup_config)
+    return backup_config
+
+
+def invalidate(pod_id: str) -> None:
+    """Drop the cached backup config for a pod."""
+    _configs.pop(pod_id, None)
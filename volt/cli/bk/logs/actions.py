@@ -1,5 +1,8 @@
+from typing import TYPE_CHECKING
+
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
 
 
 class GetBackupLogsAction:
@@ -2,9 +2,8 @@ from typing import Optional
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
+from lium.cli.utils import handle_errors, ensure_config, get_lium
 from . import validation, parsing, display
 from .actions import GetBackupLogsAction
 
@@ -23,7 +22,7 @@ def bk_logs_command(pod_id: Optional[str], backup_id: Optional[str]):
         ui.error(error)
         return
 
-    lium = Lium()
+    lium = get_lium()
 
     if backup_id:
         ctx = {"lium": lium, "backup_id": backup_id}
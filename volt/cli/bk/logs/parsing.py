@@ -1,12 +1,13 @@
 """Parsing logic for bk logs command."""
 
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import parse_targets
 
 
-def parse(pod_id: str | None, all_pods: List[PodInfo]) -> tuple[dict | None, str]:
+def parse(pod_id: str | None, all_pods: List["PodInfo"]) -> tuple[dict | None, str]:
     """Parse bk logs arguments."""
 
     if not pod_id:
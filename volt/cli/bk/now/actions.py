@@ -1,5 +1,9 @@
+from typing import TYPE_CHECKING
+
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
+from lium.cli.bk._cache import get_backup_config
 
 
 class TriggerBackupAction:
@@ -14,7 +18,7 @@ class TriggerBackupAction:
 
         try:
             # Check if backup config exists
-            backup_config = lium.backup_config(pod)
+            backup_config = get_backup_config(lium, pod)
 
             if not backup_config:
                 return ActionResult(ok=False, data={}, error="No backup configuration found")
@@ -26,6 +30,6 @@ class TriggerBackupAction:
                 description=description
             )
 
-            return ActionResult(ok=True, data={})
+            return ActionResult.OK_EMPTY
         except Exception as e:
             return ActionResult(ok=False, data={}, error=str(e))
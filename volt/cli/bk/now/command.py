@@ -4,9 +4,8 @@ from typing import Optional
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
+from lium.cli.utils import handle_errors, ensure_config, get_lium
 from . import validation, parsing
 from .actions import TriggerBackupAction
 
@@ -27,7 +26,7 @@ def bk_now_command(pod_id: str, name: Optional[str], description: Optional[str])
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
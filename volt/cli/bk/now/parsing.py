@@ -1,9 +1,10 @@
 """Parsing logic for bk now command."""
 
 from datetime import datetime
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import parse_targets
 
 
@@ -11,7 +12,7 @@ def parse(
     pod_id: str,
     name: str | None,
     description: str | None,
-    all_pods: List[PodInfo]
+    all_pods: List["PodInfo"]
 ) -> tuple[dict | None, str]:
     """Parse bk now arguments."""
 
@@ -1,5 +1,8 @@
+from typing import TYPE_CHECKING
+
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
 
 
 class RestoreBackupAction:
@@ -15,6 +18,6 @@ class RestoreBackupAction:
         try:
             lium.restore(pod=pod, backup_id=backup_id, restore_path=restore_path)
 
-            return ActionResult(ok=True, data={})
+            return ActionResult.OK_EMPTY
         except Exception as e:
             return ActionResult(ok=False, data={}, error=str(e))
@@ -1,8 +1,8 @@
+
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
+from lium.cli.utils import handle_errors, ensure_config, get_lium
 from . import validation, parsing
 from .actions import RestoreBackupAction
 
@@ -24,7 +24,7 @@ def bk_restore_command(pod_id: str, backup_id: str, restore_path: str, yes: bool
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
@@ -1,5 +1,9 @@
+from typing import TYPE_CHECKING
+
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
+from lium.cli.bk._cache import get_backup_config, invalidate
 
 
 class RemoveBackupAction:
@@ -11,13 +15,14 @@ class RemoveBackupAction:
         pod: PodInfo = ctx["pod"]
 
         try:
-            backup_config = lium.backup_config(pod)
+            backup_config = get_backup_config(lium, pod)
 
             if not backup_config:
                 return ActionResult(ok=False, data={}, error="No backup configuration found")
 
             lium.backup_delete(backup_config.id)
+            invalidate(pod.id)
 
-            return ActionResult(ok=True, data={})
+            return ActionResult.OK_EMPTY
         except Exception as e:
             return ActionResult(ok=False, data={}, error=str(e))
@@ -1,5 +1,9 @@
+from typing import TYPE_CHECKING
+
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
+from lium.cli.bk._cache import get_backup_config, invalidate
 
 
 class SetBackupAction:
@@ -7,6 +11,7 @@ class SetBackupAction:
 
     def execute(self, ctx: dict) -> ActionResult:
         """Execute backup set."""
+        from lium.sdk import LiumNotFoundError
         lium: Lium = ctx["lium"]
         pod: PodInfo = ctx["pod"]
         path: str = ctx["path"]
@@ -14,20 +19,42 @@ class SetBackupAction:
         retention_days: int = ctx["retention_days"]
 
         try:
-            # Check if backup already exists
-            existing_config = lium.backup_config(pod)
-
-            if existing_config:
-                lium.backup_delete(existing_config.id)
+            upsert = getattr(lium, "backup_upsert", None)
+            if upsert is None:
+                # Older SDK without backup_upsert
+                self._replace(lium, pod, path, frequency_hours, retention_days)
+            else:
+                try:
+                    # Single idempotent call, resolved atomically by the server
+                    upsert(
+                        pod=pod,
+                        path=path,
+                        frequency_hours=frequency_hours,
+                        retention_days=retention_days
+                    )
+                except LiumNotFoundError:
+                    # Server without PUT /backups
+                    self._replace(lium, pod, path, frequency_hours, retention_days)
 
-            # Create new backup config
-            lium.backup_create(
-                pod=pod,
-                path=path,
-                frequency_hours=frequency_hours,
-                retention_days=retention_days
-            )
+            invalidate(pod.id)
 
-            return ActionResult(ok=True, data={})
+            return ActionResult.OK_EMPTY
         except Exception as e:
             return ActionResult(ok=False, data={}, error=str(e))
+
+    def _replace(self, lium: "Lium", pod: "PodInfo", path: str, frequency_hours: int, retention_days: int) -> None:
+        """Delete any existing backup config, then create the new one."""
+        # Check if backup already exists
+        existing_config = get_backup_config(lium, pod)
+
+        if existing_config:
+            lium.backup_delete(existing_config.id)
+            invalidate(pod.id)
+
+        # Create new backup config
+        lium.backup_create(
+            pod=pod,
+            path=path,
+            frequency_hours=frequency_hours,
+            retention_days=retention_days
+        )
@@ -2,9 +2,8 @@
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
+from lium.cli.utils import handle_errors, ensure_config, get_lium
 from . import validation, parsing
 from .actions import SetBackupAction
 
@@ -38,7 +37,7 @@ def bk_set_command(pod_id: str, path: str, every: str, keep: str, yes: bool):
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
@@ -1,9 +1,10 @@
 """Parsing logic for bk set command."""
 
 import re
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import parse_targets
 from lium.cli.settings import config
 
@@ -13,7 +14,7 @@ def parse(
     path: str,
     every: str | None,
     keep: str | None,
-    all_pods: List[PodInfo]
+    all_pods: List["PodInfo"]
 ) -> tuple[dict | None, str]:
     """Parse bk set arguments."""
 
@@ -1,7 +1,10 @@
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
+from lium.cli.bk._cache import get_backup_config
 
 
 class ShowBackupAction:
@@ -13,7 +16,7 @@ class ShowBackupAction:
         pod: PodInfo = ctx["pod"]
 
         try:
-            backup_config = lium.backup_config(pod)
+            backup_config = get_backup_config(lium, pod)
 
             if not backup_config:
                 return ActionResult(ok=True, data={"has_config": False})
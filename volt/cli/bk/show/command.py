@@ -2,9 +2,8 @@
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
+from lium.cli.utils import handle_errors, ensure_config, get_lium
 from . import validation, parsing
 from .actions import ShowBackupAction
 
@@ -34,7 +33,7 @@ def bk_show_command(pod_id: str):
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
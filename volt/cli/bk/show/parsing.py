@@ -1,12 +1,13 @@
 """Parsing logic for bk show command."""
 
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
 from lium.cli.utils import parse_targets
 
 
-def parse(pod_id: str, all_pods: List[PodInfo]) -> tuple[dict | None, str]:
+def parse(pod_id: str, all_pods: List["PodInfo"]) -> tuple[dict | None, str]:
     """Parse bk show arguments."""
 
     selected_pods = parse_targets(pod_id, all_pods)
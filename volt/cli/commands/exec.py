@@ -3,18 +3,19 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Optional, List, Tuple
+from typing import TYPE_CHECKING, Optional, List, Tuple
 from pathlib import Path
 
 import click
 from rich.text import Text
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from lium.sdk import Lium, PodInfo
-from ..utils import console, handle_errors, loading_status, parse_targets
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
+from ..utils import console, get_lium, handle_errors, loading_status, parse_targets
 
 
-def _format_output(pod: PodInfo, result: dict, show_header: bool = True) -> None:
+def _format_output(pod: "PodInfo", result: dict, show_header: bool = True) -> None:
     """Format and display execution output."""
     if show_header:
         console.info(f"\n── {pod.huid} ──")
@@ -88,7 +89,7 @@ def exec_command(targets: str, command: Optional[str], script: Optional[str], en
         env_dict[key] = value
     
     # Get pods and resolve targets
-    lium = Lium()
+    lium = get_lium()
     with loading_status("Loading pods", ""):
         all_pods = lium.ps()
     
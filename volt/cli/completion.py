@@ -5,7 +5,6 @@ from functools import cache
 from pathlib import Path
 from typing import Dict, Tuple, List
 
-from lium.sdk import Lium
 
 # Shell configurations: (config_file, completion_script)
 SHELLS: Dict[str, Tuple[str, str]] = {
@@ -60,7 +59,8 @@ def ensure_completion() -> None:
 
 @cache
 def _get_full_gpu_types() -> List[str]:
-    return sorted(list(Lium().gpu_types()))
+    from lium.cli.utils import get_lium
+    return sorted(list(get_lium().gpu_types()))
 
 
 def get_gpu_completions(ctx, param, incomplete):
@@ -14,9 +14,24 @@ class EditConfigAction:
         config_file = config.get_config_path()
         editor = os.environ.get('EDITOR', 'nano' if sys.platform != 'win32' else 'notepad')
 
+        if sys.platform == 'win32':
+            return self._run_editor(editor, str(config_file))
+
+        # Nothing happens after editing, so replace this process with the editor
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execvp(editor, [editor, str(config_file)])
+        except FileNotFoundError:
+            return ActionResult(ok=False, data={}, error=f"Editor not found: {editor}")
+        except OSError:
+            return ActionResult(ok=False, data={}, error=f"Failed to open editor: {editor}")
+
+    def _run_editor(self, editor: str, config_file: str) -> ActionResult:
+        """Run editor as a child process (Windows, where exec does not replace the console process)."""
         try:
-            subprocess.run([editor, str(config_file)], check=True)
-            return ActionResult(ok=True, data={})
+            subprocess.run([editor, config_file], check=True)
+            return ActionResult.OK_EMPTY
         except subprocess.CalledProcessError:
             return ActionResult(ok=False, data={}, error=f"Failed to open editor: {editor}")
         except FileNotFoundError:
@@ -5,6 +5,11 @@ from lium.cli.settings import config
 class GetConfigAction:
     """Get config value."""
 
+    @classmethod
+    def fast_get(cls, key: str) -> str | None:
+        """Return the config value directly, or None if not set."""
+        return config.get(key)
+
     def execute(self, ctx: dict) -> ActionResult:
         """Execute config get."""
         key: str = ctx["key"]
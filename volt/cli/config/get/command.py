@@ -1,5 +1,7 @@
 """Config get command implementation."""
 
+import sys
+
 import click
 
 from lium.cli import ui
@@ -27,16 +29,11 @@ def config_get_command(key: str):
         ui.error(error)
         return
 
-    # Execute
-    ctx = {"key": key}
-
-    action = GetConfigAction()
-    result = action.execute(ctx)
+    # Execute (no ActionResult round-trip, this is called from scripts and prompts)
+    value = GetConfigAction.fast_get(key)
 
-    if not result.ok:
-        ui.error(result.error)
+    if value is None:
+        ui.error(f"Key '{key}' not found")
         return
 
-    value = result.data.get("value")
-    styled_value = mask_value(value, key)
-    ui.info(styled_value)
+    sys.stdout.write(mask_value(value, key) + "\n")
@@ -0,0 +1,13 @@
+"""Print the config file path without building the full CLI.
+
+Only the config command group is imported (which still loads Click), not
+the root command and every other command module.
+
+Scripting-friendly alias for 'lium config path':
+
+    python -m volt.cli.config.path
+"""
+
+from lium.cli.settings import config
+
+print(config.get_config_path())
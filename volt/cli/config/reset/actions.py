@@ -14,4 +14,4 @@ class ResetConfigAction:
 
         config_file.unlink()
 
-        return ActionResult(ok=True, data={})
+        return ActionResult.OK_EMPTY
@@ -14,4 +14,4 @@ class UnsetConfigAction:
         if not removed:
             return ActionResult(ok=False, data={}, error=f"Key '{key}' not found")
 
-        return ActionResult(ok=True, data={})
+        return ActionResult.OK_EMPTY
@@ -95,7 +95,7 @@ class ExecuteTransferAction:
             if not success:
                 return ActionResult(ok=False, data={}, error="Transfer failed")
 
-            return ActionResult(ok=True, data={})
+            return ActionResult.OK_EMPTY
         except Exception as e:
             return ActionResult(ok=False, data={}, error=str(e))
 
@@ -5,9 +5,8 @@ from typing import Optional
 import click
 from rich.prompt import Prompt
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors
+from lium.cli.utils import handle_errors, get_lium
 from lium.cli.settings import config
 from . import validation
 from .actions import (
@@ -58,7 +57,7 @@ def fund_command(wallet: Optional[str], amount: Optional[str], yes: bool):
     wallet_address = result.data["address"]
 
     # Initialize Lium SDK
-    lium = Lium()
+    lium = get_lium()
 
     # Check/register wallet
     ctx = {
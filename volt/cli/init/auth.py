@@ -1,4 +1,4 @@
-import os, sys, time, requests, webbrowser
+import os, sys, time, webbrowser
 from typing import Optional
 
 from lium.cli import ui
@@ -18,8 +18,10 @@ class quiet_fds:
         self._null.close()
 
 def init_auth():
+    from volt.sdk.utils import get_session
+
     url = "https://lium.io/api/cli-auth/init"
-    resp = requests.post(url,
+    resp = get_session().post(url,
         json={"callback_url": "http://localhost:8080/auth/callback"},
         headers={"Content-Type": "application/json"},
         timeout=10
@@ -28,10 +30,13 @@ def init_auth():
     return resp.json()["browser_url"], resp.json()["session_id"]
 
 def poll_auth(session_id, max_attempts=6, interval=5) -> Optional[str]:  # 30 seconds timeout (6 * 5)
+    from volt.sdk.utils import get_session
+
     url = f"https://lium.io/api/cli-auth/poll/{session_id}"
+    session = get_session()
     for _ in range(max_attempts):
         try:
-            resp = requests.get(url, timeout=5)
+            resp = session.get(url, timeout=5)
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get("status") == "approved":
@@ -1,9 +1,36 @@
 """Actions for logs command."""
 
-import json
-from typing import Generator
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Generator, Iterable, Optional, Union
 
-from lium.sdk import Lium, PodInfo
+import orjson
+
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
+
+# SSE data-line prefix, matched against raw bytes
+_PREFIX = b"data: "
+_PREFIX_LEN = len(_PREFIX)
+
+# Parsed lines buffered ahead of the terminal while following
+RING_SIZE = 8192
+
+
+def _parse_line(line: Union[bytes, str]) -> Optional[str]:
+    """Parse one SSE line, returns the log text or None if it carries no log."""
+    if isinstance(line, str):
+        line = line.encode("utf-8")
+
+    # Parse SSE format: b'data: {"log": "actual log content"}'
+    if len(line) > _PREFIX_LEN and line[:_PREFIX_LEN] == _PREFIX:
+        try:
+            data = orjson.loads(memoryview(line)[_PREFIX_LEN:])
+        except orjson.JSONDecodeError:
+            return line.decode("utf-8", errors="replace")
+        return data["log"] if "log" in data else None
+
+    return line.decode("utf-8", errors="replace")
 
 
 class StreamLogsAction:
@@ -23,17 +50,68 @@ class StreamLogsAction:
         tail: int = ctx["tail"]
         follow: bool = ctx["follow"]
 
-        for line in lium.logs(pod.id, tail=tail, follow=follow):
-            if isinstance(line, bytes):
-                line = line.decode("utf-8", errors="replace")
-
-            # Parse SSE format: "data: {"log": "actual log content"}"
-            if line.startswith("data: "):
-                try:
-                    data = json.loads(line[6:])
-                    if "log" in data:
-                        yield data["log"]
-                except json.JSONDecodeError:
-                    yield line
-            else:
-                yield line
+        lines = lium.logs(pod.id, tail=tail, follow=follow)
+        if follow:
+            yield from self._read_ahead(lines)
+            return
+
+        for line in lines:
+            text = _parse_line(line)
+            if text is not None:
+                yield text
+
+    def _read_ahead(self, lines: Iterable[Union[bytes, str]]) -> Generator[str, None, None]:
+        """Read and parse the stream on a thread into a bounded ring buffer.
+
+        A slow terminal no longer stalls the SSE read. If output falls more
+        than RING_SIZE lines behind, the oldest lines are dropped and a
+        marker with the dropped count is emitted at the end.
+        """
+        ring = deque(maxlen=RING_SIZE)
+        cond = threading.Condition()
+        stop = threading.Event()
+        done = False
+        dropped = 0
+        error = None
+
+        def produce():
+            nonlocal done, dropped, error
+            try:
+                for line in lines:
+                    if stop.is_set():
+                        break
+                    text = _parse_line(line)
+                    if text is None:
+                        continue
+                    with cond:
+                        if len(ring) == RING_SIZE:
+                            dropped += 1
+                        ring.append(text)
+                        cond.notify()
+            except Exception as e:
+                error = e
+            finally:
+                with cond:
+                    done = True
+                    cond.notify()
+
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while True:
+                with cond:
+                    while not ring and not done:
+                        cond.wait()
+                    batch = list(ring)
+                    ring.clear()
+                    finished = done
+                yield from batch
+                if finished:
+                    break
+        finally:
+            # Also stops the reader when the consumer goes away early
+            stop.set()
+
+        if error is not None:
+            raise error
+        if dropped:
+            yield f"[{dropped} lines dropped]"
@@ -2,10 +2,9 @@
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
-from . import validation, parsing
+from lium.cli.utils import handle_errors, ensure_config, get_lium
+from . import validation, parsing, display
 from .actions import StreamLogsAction
 
 
@@ -36,7 +35,7 @@ def logs_command(pod_id: str, tail: int, follow: bool):
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
@@ -59,8 +58,7 @@ def logs_command(pod_id: str, tail: int, follow: bool):
     action = StreamLogsAction()
 
     try:
-        for line in action.execute(ctx):
-            click.echo(line)
+        display.write_lines(action.execute(ctx), follow=follow)
     except KeyboardInterrupt:
         if follow:
             ui.dim("\nStopped following logs")
@@ -0,0 +1,98 @@
+"""Output logic for logs command."""
+
+import io
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Tuple
+
+BUFFER_SIZE = 65536
+FLUSH_INTERVAL = 0.05
+
+
+def _write(buf: io.BufferedWriter, data: bytes) -> None:
+    """Write data, backing off while the downstream pipe is full."""
+    while True:
+        try:
+            buf.write(data)
+            return
+        except BlockingIOError as e:
+            data = data[e.characters_written:]
+            time.sleep(0.001)
+
+
+def _flush(buf: io.BufferedWriter) -> None:
+    """Flush buffered data, backing off while the downstream pipe is full."""
+    while True:
+        try:
+            buf.flush()
+            return
+        except BlockingIOError:
+            time.sleep(0.001)
+
+
+def _silence_stdout() -> None:
+    """Point stdout at devnull so pending output can't raise at exit."""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+
+@contextmanager
+def _stdout_buffer(follow: bool) -> Iterator[Tuple[io.BufferedWriter, threading.Event]]:
+    """Yield a 64 KiB buffered writer over stdout and a pipe-closed event.
+
+    When following, buffered output is flushed every 50 ms so the terminal
+    keeps up with the stream; otherwise it is flushed once at the end. The
+    event is set once the periodic flush finds the pipe closed, so writers
+    can stop early. A closed pipe (e.g. piping into head) ends output
+    quietly, as click.echo does.
+    """
+    sys.stdout.flush()
+    buf = io.BufferedWriter(sys.stdout.buffer, buffer_size=BUFFER_SIZE)
+
+    stop = threading.Event()
+    closed = threading.Event()
+    flusher = None
+    if follow:
+        def _flush_periodically():
+            try:
+                while not stop.wait(FLUSH_INTERVAL):
+                    _flush(buf)
+            except BrokenPipeError:
+                closed.set()
+
+        flusher = threading.Thread(target=_flush_periodically, daemon=True)
+        flusher.start()
+
+    broken = False
+    try:
+        yield buf, closed
+    except BrokenPipeError:
+        broken = True
+    finally:
+        stop.set()
+        if flusher:
+            flusher.join()
+        broken = broken or closed.is_set()
+        if not broken:
+            try:
+                _flush(buf)
+            except BrokenPipeError:
+                broken = True
+        if broken:
+            _silence_stdout()
+        # Leave sys.stdout.buffer open for the rest of the CLI
+        buf.detach()
+
+
+def write_lines(lines: Iterable[str], follow: bool = False) -> None:
+    """Write log lines to stdout through a 64 KiB buffer."""
+    with _stdout_buffer(follow) as (buf, closed):
+        for line in lines:
+            if closed.is_set():
+                raise BrokenPipeError
+            _write(buf, line.encode("utf-8") + b"\n")
+
@@ -0,0 +1,50 @@
+"""On-disk cache for executor listings."""
+
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+# Seconds a cached listing stays fresh
+TTL = 15.0
+
+
+def _cache_dir() -> Path:
+    """Get $XDG_CACHE_HOME/volt/ls (defaults to ~/.cache/volt/ls)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "volt" / "ls"
+
+
+def _cache_file(key: Hashable) -> Path:
+    """Get the cache file for a filter key."""
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    return _cache_dir() / f"{digest}.pkl"
+
+
+def get_or_fetch(key: Hashable, fetcher: Callable[[], T], ttl: float = TTL) -> T:
+    """Return the cached value for key if younger than ttl, otherwise fetch and store it."""
+    cache_file = _cache_file(key)
+
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+        pass
+
+    value = fetcher()
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except (OSError, pickle.PickleError):
+        pass
+
+    return value
@@ -1,6 +1,7 @@
 from typing import List
 
 from lium.cli.actions import ActionResult
+from . import _cache
 
 
 class GetExecutorsAction:
@@ -16,15 +17,22 @@ class GetExecutorsAction:
         lat = ctx.get("lat")
         lon = ctx.get("lon")
         max_distance = ctx.get("max_distance")
+        no_cache = ctx.get("no_cache", False)
 
-        try:
-            executors = lium.ls(
+        def fetch():
+            return lium.ls(
                 gpu_type=gpu_type,
                 gpu_count=gpu_count,
                 lat=lat,
                 lon=lon,
                 max_distance_miles=max_distance,
             )
+
+        try:
+            if no_cache:
+                executors = fetch()
+            else:
+                executors = _cache.get_or_fetch((gpu_type, gpu_count, lat, lon, max_distance), fetch)
             return ActionResult(
                 ok=True,
                 data={"executors": executors}
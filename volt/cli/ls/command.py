@@ -1,34 +1,75 @@
 """List (ls) command implementation."""
 
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 import click
 
-from lium.sdk import Lium, ExecutorInfo
+if TYPE_CHECKING:
+    from lium.sdk import ExecutorInfo
 from lium.cli import ui
-from lium.cli.utils import handle_errors, store_executor_selection, calculate_pareto_frontier
+from lium.cli.utils import (
+    get_lium,
+    handle_errors,
+    store_executor_selection,
+    load_executor_selection,
+    calculate_pareto_frontier,
+)
 from lium.cli.completion import get_gpu_completions
-from . import validation, display
+from . import validation, display, _cache
 from .actions import GetExecutorsAction
 
 
-def ls_store_executor(gpu_type: Optional[str] = None, sort_by: str = "price_gpu") -> List[ExecutorInfo]:
-    """Load and store executors without displaying them."""
-    lium = Lium()
-    executors = lium.ls(gpu_type=gpu_type)
+# Below this size the NumPy setup costs more than the Python sort
+_NUMPY_SORT_MIN = 64
 
-    if not executors:
-        return []
 
-    pareto_flags = calculate_pareto_frontier(executors)
-    executors_with_pareto = list(zip(executors, pareto_flags))
+def _sort_pareto_first(executors: List["ExecutorInfo"], pareto_flags: List[bool]) -> List["ExecutorInfo"]:
+    """Sort executors Pareto-optimal first, then by price per GPU hour (stable)."""
+    if len(executors) >= _NUMPY_SORT_MIN:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None:
+            count = len(executors)
+            not_pareto = np.fromiter((0 if f else 1 for f in pareto_flags), dtype=np.int8, count=count)
+            price = np.fromiter((e.price_per_gpu_hour or 0.0 for e in executors), dtype=np.float64, count=count)
+            order = np.lexsort((price, not_pareto))
+            return [executors[i] for i in order]
 
     executors_with_pareto = sorted(
-        executors_with_pareto,
+        zip(executors, pareto_flags),
         key=lambda x: (not x[1], x[0].price_per_gpu_hour or 0.0)
     )
+    return [e for e, _ in executors_with_pareto]
 
-    sorted_executors = [e for e, _ in executors_with_pareto]
-    store_executor_selection(sorted_executors)
+
+def ls_store_executor(
+    gpu_type: Optional[str] = None,
+    sort_by: str = "price_gpu",
+    use_cache: bool = True,
+) -> List["ExecutorInfo"]:
+    """Load and store executors without displaying them."""
+    filters = (gpu_type, None, None, None, None)
+
+    # Reuse a fresh selection stored by 'ls' (or a previous call) with the same filters
+    if use_cache:
+        stored = load_executor_selection(filters)
+        if stored:
+            return stored[0]
+
+    lium = get_lium()
+    if use_cache:
+        executors = _cache.get_or_fetch(filters, lambda: lium.ls(gpu_type=gpu_type))
+    else:
+        executors = lium.ls(gpu_type=gpu_type)
+
+    if not executors:
+        return []
+
+    pareto_flags = calculate_pareto_frontier(executors)
+    sorted_executors = _sort_pareto_first(executors, pareto_flags)
+    store_executor_selection(sorted_executors, filters=filters)
 
     return sorted_executors
 
@@ -47,6 +88,7 @@ def ls_store_executor(gpu_type: Optional[str] = None, sort_by: str = "price_gpu"
     help="Sort result by the chosen field.",
 )
 @click.option("--limit", type=int, default=None, help="Limit number of rows shown.")
+@click.option("--no-cache", "no_cache", is_flag=True, help="Bypass the short-lived executor cache.")
 @handle_errors
 def ls_command(
     gpu_type: Optional[str],
@@ -56,6 +98,7 @@ def ls_command(
     max_distance: Optional[int],
     sort_by: str,
     limit: Optional[int],
+    no_cache: bool,
 ):
     """List available GPU executors."""
 
@@ -66,7 +109,7 @@ def ls_command(
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     ctx = {
         "lium": lium,
         "gpu_type": gpu_type,
@@ -74,6 +117,7 @@ def ls_command(
         "lat": lat,
         "lon": lon,
         "max_distance": max_distance,
+        "no_cache": no_cache,
     }
 
     action = GetExecutorsAction()
@@ -108,5 +152,6 @@ def ls_command(
     ui.print("")
     ui.info(tip)
 
-    # Store selection for index-based access in up command
-    store_executor_selection(sorted_executors)
+    # Store selection for index-based access in up command (reusable by up only when not truncated)
+    filters = None if limit else (gpu_type, gpu_count, lat, lon, max_distance)
+    store_executor_selection(sorted_executors, filters=filters)
@@ -1,10 +1,11 @@
 """Display formatting logic for ls command."""
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from rich.table import Table
 
-from lium.sdk import ExecutorInfo
+if TYPE_CHECKING:
+    from lium.sdk import ExecutorInfo
 from lium.cli.utils import console, calculate_pareto_frontier
 
 
@@ -20,7 +21,7 @@ def _mid_ellipsize(s: str, width: int = 28) -> str:
     return f"{s[:left]}…{s[-right:]}"
 
 
-def _cfg(exe: ExecutorInfo) -> str:
+def _cfg(exe: "ExecutorInfo") -> str:
     """Format GPU configuration string."""
     return f"{exe.gpu_count}×{exe.gpu_type}"
 
@@ -102,7 +103,7 @@ def _specs_row(specs: Optional[Dict]) -> Dict[str, str]:
     }
 
 
-def _sort_key_factory(name: str) -> Callable[[ExecutorInfo], Any]:
+def _sort_key_factory(name: str) -> Callable[["ExecutorInfo"], Any]:
     """Get sort key function by name."""
     mapping = {
         "price_gpu": lambda e: e.price_per_gpu_hour or 0.0,
@@ -143,11 +144,11 @@ def format_tip() -> str:
 
 
 def build_executors_table(
-    executors: List[ExecutorInfo],
+    executors: List["ExecutorInfo"],
     sort_by: str = "price_gpu",
     limit: Optional[int] = None,
     show_pareto: bool = True
-) -> tuple[Table, List[ExecutorInfo], str, str]:
+) -> tuple[Table, List["ExecutorInfo"], str, str]:
     """Build executors table, returns (table, sorted_executors, header, tip)."""
 
     if not executors:
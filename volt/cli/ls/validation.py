@@ -1,5 +1,21 @@
 """Validation logic for ls command."""
 
+_VALID_SORT = frozenset({"price_gpu", "price_total", "loc", "id", "gpu"})
+
+# (predicate, message) pairs checked in order; messages are only formatted on failure
+_RULES = (
+    (lambda sort_by, limit, lat, lon, max_distance: sort_by not in _VALID_SORT,
+     "Invalid sort option: {sort_by}"),
+    (lambda sort_by, limit, lat, lon, max_distance: limit is not None and limit <= 0,
+     "Limit must be a positive integer"),
+    (lambda sort_by, limit, lat, lon, max_distance: (lat is None) != (lon is None),
+     "Both --lat and --lon must be provided together"),
+    (lambda sort_by, limit, lat, lon, max_distance: max_distance is not None and max_distance <= 0,
+     "--max-distance must be positive"),
+    (lambda sort_by, limit, lat, lon, max_distance: max_distance is not None and lat is None,
+     "--max-distance requires --lat and --lon"),
+)
+
 
 def validate(
     sort_by: str,
@@ -9,23 +25,8 @@ def validate(
     max_distance: int | None,
 ) -> tuple[bool, str | None]:
     """Validate ls command options, returns (is_valid, error_message)."""
-
-    # Validate sort_by
-    valid_sort_options = ["price_gpu", "price_total", "loc", "id", "gpu"]
-    if sort_by not in valid_sort_options:
-        return False, f"Invalid sort option: {sort_by}"
-
-    # Validate limit
-    if limit is not None and limit <= 0:
-        return False, "Limit must be a positive integer"
-
-    if (lat is None) ^ (lon is None):
-        return False, "Both --lat and --lon must be provided together"
-
-    if max_distance is not None and max_distance <= 0:
-        return False, "--max-distance must be positive"
-
-    if max_distance is not None and (lat is None or lon is None):
-        return False, "--max-distance requires --lat and --lon"
+    for predicate, message in _RULES:
+        if predicate(sort_by, limit, lat, lon, max_distance):
+            return False, message.format(sort_by=sort_by)
 
     return True, None
@@ -1,21 +1,91 @@
 """VoltageGPU CLI - Main entry point."""
 
+import atexit
+import os
 import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+import orjson
 
 from volt.sdk import VoltageGPUClient, Config
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Pod status -> Rich color
+_STATUS_COLORS = {
+    "running": "green",
+    "stopped": "red",
+    "starting": "yellow",
+    "stopping": "yellow",
+}
+_STATUS_DEFAULT = "white"
+
+
+_CLIENT: Optional[VoltageGPUClient] = None
+
+# Console width when stdout is not a terminal (Rich's own default)
+_PIPE_WIDTH = 80
+
+
+def _trunc(s: str, keep: int = 12) -> str:
+    """Shorten s to keep chars plus "..." when that actually saves space."""
+    return s if len(s) <= keep + 3 else s[:keep] + "..."
+
+
+def _echo_json(data: Any) -> None:
+    """Write data to stdout as indented JSON."""
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+
+
+def _echo_fields(fields: Dict[str, Any]) -> None:
+    """Write fields to stdout as plain "key: value" lines."""
+    sys.stdout.write("".join(f"{k}: {v}\n" for k, v in fields.items()))
+
+
+def _pipe_width() -> int:
+    """Console width for piped output: $COLUMNS when it is a positive integer."""
+    try:
+        width = int(os.environ.get("COLUMNS") or _PIPE_WIDTH)
+    except ValueError:
+        return _PIPE_WIDTH
+    return width if width > 0 else _PIPE_WIDTH
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Get the shared Rich console, importing Rich on first use.
+
+    When stdout is piped, colors are off and the width is fixed up front,
+    so Rich neither emits ANSI codes nor queries the terminal size.
+    """
+    from rich.console import Console
+    if sys.stdout.isatty():
+        return Console(highlight=False)
+    return Console(
+        force_terminal=False,
+        no_color=True,
+        highlight=False,
+        width=_pipe_width()
+    )
 
 
 def get_client() -> VoltageGPUClient:
-    """Get configured VoltageGPU client."""
+    """Get configured VoltageGPU client.
+
+    One client is shared for the whole process so API calls reuse pooled
+    connections; it is closed at exit.
+    """
+    global _CLIENT
+    if _CLIENT is not None:
+        return _CLIENT
+
     try:
-        return VoltageGPUClient()
+        config = Config.load()
     except ValueError as e:
+        console = get_console()
         console.print(f"[red]Error:[/red] {e}")
         console.print("\n[yellow]To configure your API key:[/yellow]")
         console.print("  1. Set VOLT_API_KEY environment variable")
@@ -24,6 +94,11 @@ def get_client() -> VoltageGPUClient:
         console.print("     api_key = your_api_key_here")
         sys.exit(1)
 
+    http_client = VoltageGPUClient.create_http_client(config)
+    atexit.register(http_client.close)
+    _CLIENT = VoltageGPUClient(config, http_client=http_client)
+    return _CLIENT
+
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="volt")
@@ -47,79 +122,97 @@ def pods():
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def pods_list(as_json: bool):
     """List all your pods."""
-    with get_client() as client:
-        pods = client.list_pods()
-        
-        if as_json:
-            import json
-            data = [{"id": p.id, "name": p.name, "status": p.status, 
-                    "gpu_type": p.gpu_type, "gpu_count": p.gpu_count,
-                    "hourly_price": p.hourly_price} for p in pods]
-            click.echo(json.dumps(data, indent=2))
-            return
-        
-        if not pods:
-            console.print("[yellow]No pods found.[/yellow]")
-            console.print("Create one with: volt pods create --template <template_id> --name <name>")
-            return
-        
-        table = Table(title="Your Pods")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Status", style="bold")
-        table.add_column("GPU", style="magenta")
-        table.add_column("Count")
-        table.add_column("$/hr", style="yellow")
-        
-        for pod in pods:
-            status_color = {
-                "running": "green",
-                "stopped": "red",
-                "starting": "yellow",
-                "stopping": "yellow"
-            }.get(pod.status.lower(), "white")
-            
-            table.add_row(
-                pod.id[:12] + "...",
-                pod.name,
-                f"[{status_color}]{pod.status}[/{status_color}]",
-                pod.gpu_type,
-                str(pod.gpu_count),
-                f"${pod.hourly_price:.2f}"
-            )
-        
-        console.print(table)
+    client = get_client()
+    pods = client.list_pods()
+    
+    if as_json:
+        data = [{"id": p.id, "name": p.name, "status": p.status, 
+                "gpu_type": p.gpu_type, "gpu_count": p.gpu_count,
+                "hourly_price": p.hourly_price} for p in pods]
+        _echo_json(data)
+        return
+
+    from rich.table import Table
+    from rich.text import Text
+    console = get_console()
+    
+    if not pods:
+        console.print("[yellow]No pods found.[/yellow]")
+        console.print("Create one with: volt pods create --template <template_id> --name <name>")
+        return
+    
+    table = Table(title="Your Pods", show_edge=False, show_lines=False, pad_edge=False)
+    table.add_column("ID", style="cyan", no_wrap=True, overflow="ignore")
+    table.add_column("Name", style="green", no_wrap=True, overflow="ignore")
+    table.add_column("Status", style="bold", no_wrap=True, overflow="ignore")
+    table.add_column("GPU", style="magenta", no_wrap=True, overflow="ignore")
+    table.add_column("Count", no_wrap=True, overflow="ignore")
+    table.add_column("$/hr", style="yellow", no_wrap=True, overflow="ignore")
+    
+    # Cells are passed as prebuilt Text so Rich skips markup parsing per row;
+    # status cells are built once per distinct status and shared
+    status_texts = {}
+    add = table.add_row
+    color_of = _STATUS_COLORS.get
+    for pod in pods:
+        status = pod.status
+        status_cell = status_texts.get(status)
+        if status_cell is None:
+            status_cell = status_texts[status] = Text(status, style=color_of(status.lower(), _STATUS_DEFAULT))
+        add(
+            Text(pod.id[:12] + "..."),
+            Text(pod.name or ""),
+            status_cell,
+            Text(pod.gpu_type or ""),
+            str(pod.gpu_count),
+            f"${pod.hourly_price:.2f}"
+        )
+    
+    console.print(table)
 
 
 @pods.command("get")
 @click.argument("pod_id")
-def pods_get(pod_id: str):
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def pods_get(pod_id: str, as_json: bool):
     """Get details of a specific pod."""
-    with get_client() as client:
-        try:
-            pod = client.get_pod(pod_id)
-            
-            panel = Panel(
-                f"""[cyan]ID:[/cyan] {pod.id}
-[cyan]Name:[/cyan] {pod.name}
-[cyan]Status:[/cyan] {pod.status}
-[cyan]GPU Type:[/cyan] {pod.gpu_type}
-[cyan]GPU Count:[/cyan] {pod.gpu_count}
-[cyan]Hourly Price:[/cyan] ${pod.hourly_price:.2f}
-[cyan]SSH Host:[/cyan] {pod.ssh_host or 'N/A'}
-[cyan]SSH Port:[/cyan] {pod.ssh_port or 'N/A'}
-[cyan]Created:[/cyan] {pod.created_at or 'N/A'}""",
-                title=f"Pod: {pod.name}",
-                border_style="green"
-            )
-            console.print(panel)
-            
-            if pod.ssh_host and pod.ssh_port:
-                console.print(f"\n[yellow]SSH Command:[/yellow] ssh -p {pod.ssh_port} root@{pod.ssh_host}")
-                
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    client = get_client()
+    try:
+        pod = client.get_pod(pod_id)
+    except Exception as e:
+        get_console().print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    if as_json:
+        _echo_json(pod)
+        return
+
+    fields = {
+        "ID": pod.id,
+        "Name": pod.name,
+        "Status": pod.status,
+        "GPU Type": pod.gpu_type,
+        "GPU Count": pod.gpu_count,
+        "Hourly Price": f"${pod.hourly_price:.2f}",
+        "SSH Host": pod.ssh_host or "N/A",
+        "SSH Port": pod.ssh_port or "N/A",
+        "Created": pod.created_at or "N/A",
+    }
+    if not sys.stdout.isatty():
+        _echo_fields(fields)
+        return
+
+    from rich.panel import Panel
+    console = get_console()
+    panel = Panel(
+        "\n".join(f"[cyan]{k}:[/cyan] {v}" for k, v in fields.items()),
+        title=f"Pod: {pod.name}",
+        border_style="green"
+    )
+    console.print(panel)
+
+    if pod.ssh_host and pod.ssh_port:
+        console.print(f"\n[yellow]SSH Command:[/yellow] ssh -p {pod.ssh_port} root@{pod.ssh_host}")
 
 
 @pods.command("create")
@@ -129,56 +222,57 @@ def pods_get(pod_id: str):
 @click.option("--ssh-key", "-k", multiple=True, help="SSH key ID(s) to add")
 def pods_create(template: str, name: str, gpu_count: int, ssh_key: tuple):
     """Create a new pod from a template."""
-    with get_client() as client:
-        try:
-            console.print(f"[yellow]Creating pod '{name}'...[/yellow]")
-            
-            ssh_key_ids = list(ssh_key) if ssh_key else None
-            pod = client.create_pod(
-                template_id=template,
-                name=name,
-                gpu_count=gpu_count,
-                ssh_key_ids=ssh_key_ids
-            )
-            
-            console.print(f"[green]✓ Pod created successfully![/green]")
-            console.print(f"  ID: {pod.id}")
-            console.print(f"  Status: {pod.status}")
+    console = get_console()
+    client = get_client()
+    try:
+        console.print(f"[yellow]Creating pod '{name}'...[/yellow]")
+        
+        ssh_key_ids = list(ssh_key) if ssh_key else None
+        pod = client.create_pod(
+            template_id=template,
+            name=name,
+            gpu_count=gpu_count,
+            ssh_key_ids=ssh_key_ids
+        )
+        
+        console.print(f"[green]✓ Pod created successfully![/green]")
+        console.print(f"  ID: {pod.id}")
+        console.print(f"  Status: {pod.status}")
+        
+        if pod.ssh_host and pod.ssh_port:
+            console.print(f"\n[yellow]SSH Command:[/yellow] ssh -p {pod.ssh_port} root@{pod.ssh_host}")
             
-            if pod.ssh_host and pod.ssh_port:
-                console.print(f"\n[yellow]SSH Command:[/yellow] ssh -p {pod.ssh_port} root@{pod.ssh_host}")
-                
-        except Exception as e:
-            console.print(f"[red]Error creating pod:[/red] {e}")
-            sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]Error creating pod:[/red] {e}")
+        sys.exit(1)
 
 
 @pods.command("start")
 @click.argument("pod_id")
 def pods_start(pod_id: str):
     """Start a stopped pod."""
-    with get_client() as client:
-        try:
-            console.print(f"[yellow]Starting pod {pod_id}...[/yellow]")
-            pod = client.start_pod(pod_id)
-            console.print(f"[green]✓ Pod started![/green] Status: {pod.status}")
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    client = get_client()
+    try:
+        click.secho(f"Starting pod {pod_id}...", fg="yellow")
+        pod = client.start_pod(pod_id)
+        click.echo(click.style("✓ Pod started!", fg="green") + f" Status: {pod.status}")
+    except Exception as e:
+        click.echo(click.style("Error:", fg="red") + f" {e}")
+        sys.exit(1)
 
 
 @pods.command("stop")
 @click.argument("pod_id")
 def pods_stop(pod_id: str):
     """Stop a running pod."""
-    with get_client() as client:
-        try:
-            console.print(f"[yellow]Stopping pod {pod_id}...[/yellow]")
-            pod = client.stop_pod(pod_id)
-            console.print(f"[green]✓ Pod stopped![/green] Status: {pod.status}")
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    client = get_client()
+    try:
+        click.secho(f"Stopping pod {pod_id}...", fg="yellow")
+        pod = client.stop_pod(pod_id)
+        click.echo(click.style("✓ Pod stopped!", fg="green") + f" Status: {pod.status}")
+    except Exception as e:
+        click.echo(click.style("Error:", fg="red") + f" {e}")
+        sys.exit(1)
 
 
 @pods.command("delete")
@@ -186,40 +280,43 @@ def pods_stop(pod_id: str):
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
 def pods_delete(pod_id: str, yes: bool):
     """Delete a pod."""
+    client = get_client()
     if not yes:
+        # Connect while the user answers the prompt
+        client.warm_up()
         if not click.confirm(f"Are you sure you want to delete pod {pod_id}?"):
-            console.print("[yellow]Cancelled.[/yellow]")
+            click.secho("Cancelled.", fg="yellow")
             return
     
-    with get_client() as client:
-        try:
-            console.print(f"[yellow]Deleting pod {pod_id}...[/yellow]")
-            client.delete_pod(pod_id)
-            console.print(f"[green]✓ Pod deleted![/green]")
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    try:
+        click.secho(f"Deleting pod {pod_id}...", fg="yellow")
+        client.delete_pod(pod_id)
+        click.secho("✓ Pod deleted!", fg="green")
+    except Exception as e:
+        click.echo(click.style("Error:", fg="red") + f" {e}")
+        sys.exit(1)
 
 
 @pods.command("ssh")
 @click.argument("pod_id")
 def pods_ssh(pod_id: str):
     """SSH into a pod (prints the command)."""
-    with get_client() as client:
-        try:
-            pod = client.get_pod(pod_id)
-            
-            if not pod.ssh_host or not pod.ssh_port:
-                console.print("[red]Error:[/red] SSH not available for this pod")
-                sys.exit(1)
-            
-            ssh_cmd = f"ssh -p {pod.ssh_port} root@{pod.ssh_host}"
-            console.print(f"[green]SSH Command:[/green] {ssh_cmd}")
-            console.print("\n[yellow]Tip:[/yellow] Copy and paste this command to connect")
-            
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
+    console = get_console()
+    client = get_client()
+    try:
+        pod = client.get_pod(pod_id)
+        
+        if not pod.ssh_host or not pod.ssh_port:
+            console.print("[red]Error:[/red] SSH not available for this pod")
             sys.exit(1)
+        
+        ssh_cmd = f"ssh -p {pod.ssh_port} root@{pod.ssh_host}"
+        console.print(f"[green]SSH Command:[/green] {ssh_cmd}")
+        console.print("\n[yellow]Tip:[/yellow] Copy and paste this command to connect")
+        
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
 
 
 # ==================== TEMPLATES COMMANDS ====================
@@ -235,68 +332,84 @@ def templates():
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def templates_list(category: str, as_json: bool):
     """List available templates."""
-    with get_client() as client:
-        templates = client.list_templates(category=category)
-        
-        if as_json:
-            import json
-            data = [{"id": t.id, "name": t.name, "gpu_type": t.gpu_type,
-                    "hourly_price": t.hourly_price, "category": t.category} for t in templates]
-            click.echo(json.dumps(data, indent=2))
-            return
-        
-        if not templates:
-            console.print("[yellow]No templates found.[/yellow]")
-            return
-        
-        table = Table(title="Available Templates")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("GPU", style="magenta")
-        table.add_column("GPUs", justify="center")
-        table.add_column("$/hr", style="yellow")
-        table.add_column("Category")
-        
-        for t in templates:
-            table.add_row(
-                t.id[:12] + "..." if len(t.id) > 15 else t.id,
-                t.name[:30] + "..." if len(t.name) > 33 else t.name,
-                t.gpu_type,
-                f"{t.min_gpu}-{t.max_gpu}",
-                f"${t.hourly_price:.2f}",
-                t.category or "-"
-            )
-        
-        console.print(table)
+    client = get_client()
+    templates = client.list_templates(category=category)
+    
+    if as_json:
+        data = [{"id": t.id, "name": t.name, "gpu_type": t.gpu_type,
+                "hourly_price": t.hourly_price, "category": t.category} for t in templates]
+        _echo_json(data)
+        return
+
+    from rich.table import Table
+    console = get_console()
+    
+    if not templates:
+        console.print("[yellow]No templates found.[/yellow]")
+        return
+    
+    table = Table(title="Available Templates", show_edge=False, show_lines=False, pad_edge=False)
+    table.add_column("ID", style="cyan", no_wrap=True, overflow="ignore")
+    table.add_column("Name", style="green", no_wrap=True, overflow="ignore")
+    table.add_column("GPU", style="magenta", no_wrap=True, overflow="ignore")
+    table.add_column("GPUs", justify="center", no_wrap=True, overflow="ignore")
+    table.add_column("$/hr", style="yellow", no_wrap=True, overflow="ignore")
+    table.add_column("Category", no_wrap=True, overflow="ignore")
+    
+    add = table.add_row
+    for t in templates:
+        add(
+            _trunc(t.id),
+            _trunc(t.name, 30),
+            t.gpu_type,
+            f"{t.min_gpu}-{t.max_gpu}",
+            f"${t.hourly_price:.2f}",
+            t.category or "-"
+        )
+    
+    console.print(table)
 
 
 @templates.command("get")
 @click.argument("template_id")
-def templates_get(template_id: str):
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def templates_get(template_id: str, as_json: bool):
     """Get details of a specific template."""
-    with get_client() as client:
-        try:
-            t = client.get_template(template_id)
-            
-            panel = Panel(
-                f"""[cyan]ID:[/cyan] {t.id}
-[cyan]Name:[/cyan] {t.name}
-[cyan]Description:[/cyan] {t.description}
-[cyan]Docker Image:[/cyan] {t.docker_image}
-[cyan]GPU Type:[/cyan] {t.gpu_type}
-[cyan]GPU Range:[/cyan] {t.min_gpu} - {t.max_gpu}
-[cyan]Hourly Price:[/cyan] ${t.hourly_price:.2f}
-[cyan]Category:[/cyan] {t.category or 'N/A'}""",
-                title=f"Template: {t.name}",
-                border_style="blue"
-            )
-            console.print(panel)
-            
-            console.print(f"\n[yellow]Create a pod:[/yellow] volt pods create --template {t.id} --name my-pod")
-            
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    client = get_client()
+    try:
+        t = client.get_template(template_id)
+    except Exception as e:
+        get_console().print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    if as_json:
+        _echo_json(t)
+        return
+
+    fields = {
+        "ID": t.id,
+        "Name": t.name,
+        "Description": t.description,
+        "Docker Image": t.docker_image,
+        "GPU Type": t.gpu_type,
+        "GPU Range": f"{t.min_gpu} - {t.max_gpu}",
+        "Hourly Price": f"${t.hourly_price:.2f}",
+        "Category": t.category or "N/A",
+    }
+    if not sys.stdout.isatty():
+        _echo_fields(fields)
+        return
+
+    from rich.panel import Panel
+    console = get_console()
+    panel = Panel(
+        "\n".join(f"[cyan]{k}:[/cyan] {v}" for k, v in fields.items()),
+        title=f"Template: {t.name}",
+        border_style="blue"
+    )
+    console.print(panel)
+
+    console.print(f"\n[yellow]Create a pod:[/yellow] volt pods create --template {t.id} --name my-pod")
 
 
 # ==================== SSH KEYS COMMANDS ====================
@@ -311,33 +424,36 @@ def ssh_keys():
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def ssh_keys_list(as_json: bool):
     """List your SSH keys."""
-    with get_client() as client:
-        keys = client.list_ssh_keys()
-        
-        if as_json:
-            import json
-            data = [{"id": k.id, "name": k.name, "fingerprint": k.fingerprint} for k in keys]
-            click.echo(json.dumps(data, indent=2))
-            return
-        
-        if not keys:
-            console.print("[yellow]No SSH keys found.[/yellow]")
-            console.print("Add one with: volt ssh-keys add --name <name> --key <public_key>")
-            return
-        
-        table = Table(title="Your SSH Keys")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Fingerprint", style="dim")
-        
-        for key in keys:
-            table.add_row(
-                key.id[:12] + "..." if len(key.id) > 15 else key.id,
-                key.name,
-                key.fingerprint or "-"
-            )
-        
-        console.print(table)
+    client = get_client()
+    keys = client.list_ssh_keys()
+    
+    if as_json:
+        data = [{"id": k.id, "name": k.name, "fingerprint": k.fingerprint} for k in keys]
+        _echo_json(data)
+        return
+
+    from rich.table import Table
+    console = get_console()
+    
+    if not keys:
+        console.print("[yellow]No SSH keys found.[/yellow]")
+        console.print("Add one with: volt ssh-keys add --name <name> --key <public_key>")
+        return
+    
+    table = Table(title="Your SSH Keys", show_edge=False, show_lines=False, pad_edge=False)
+    table.add_column("ID", style="cyan", no_wrap=True, overflow="ignore")
+    table.add_column("Name", style="green", no_wrap=True, overflow="ignore")
+    table.add_column("Fingerprint", style="dim", no_wrap=True, overflow="ignore")
+    
+    add = table.add_row
+    for key in keys:
+        add(
+            _trunc(key.id),
+            key.name,
+            key.fingerprint or "-"
+        )
+    
+    console.print(table)
 
 
 @ssh_keys.command("add")
@@ -346,23 +462,26 @@ def ssh_keys_list(as_json: bool):
 @click.option("--file", "-f", "key_file", type=click.Path(exists=True), help="Path to public key file")
 def ssh_keys_add(name: str, key: str, key_file: str):
     """Add a new SSH key."""
+    console = get_console()
     if not key and not key_file:
         console.print("[red]Error:[/red] Provide either --key or --file")
         sys.exit(1)
     
+    client = get_client()
     if key_file:
+        # Connect while the key file is read
+        client.warm_up()
         with open(key_file) as f:
             key = f.read().strip()
     
-    with get_client() as client:
-        try:
-            ssh_key = client.add_ssh_key(name=name, public_key=key)
-            console.print(f"[green]✓ SSH key added![/green]")
-            console.print(f"  ID: {ssh_key.id}")
-            console.print(f"  Name: {ssh_key.name}")
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    try:
+        ssh_key = client.add_ssh_key(name=name, public_key=key)
+        console.print(f"[green]✓ SSH key added![/green]")
+        console.print(f"  ID: {ssh_key.id}")
+        console.print(f"  Name: {ssh_key.name}")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
 
 
 @ssh_keys.command("delete")
@@ -370,18 +489,21 @@ def ssh_keys_add(name: str, key: str, key_file: str):
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
 def ssh_keys_delete(key_id: str, yes: bool):
     """Delete an SSH key."""
+    console = get_console()
+    client = get_client()
     if not yes:
+        # Connect while the user answers the prompt
+        client.warm_up()
         if not click.confirm(f"Are you sure you want to delete SSH key {key_id}?"):
             console.print("[yellow]Cancelled.[/yellow]")
             return
     
-    with get_client() as client:
-        try:
-            client.delete_ssh_key(key_id)
-            console.print(f"[green]✓ SSH key deleted![/green]")
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    try:
+        client.delete_ssh_key(key_id)
+        console.print(f"[green]✓ SSH key deleted![/green]")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
 
 
 # ==================== MACHINES COMMANDS ====================
@@ -397,44 +519,47 @@ def machines():
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 def machines_list(gpu: str, as_json: bool):
     """List available machines."""
-    with get_client() as client:
-        machines = client.list_machines(gpu_type=gpu)
-        
-        if as_json:
-            import json
-            data = [{"id": m.id, "gpu_type": m.gpu_type, "gpu_count": m.gpu_count,
-                    "hourly_price": m.hourly_price, "available": m.available} for m in machines]
-            click.echo(json.dumps(data, indent=2))
-            return
-        
-        if not machines:
-            console.print("[yellow]No machines found.[/yellow]")
-            return
-        
-        table = Table(title="Available Machines")
-        table.add_column("ID", style="cyan")
-        table.add_column("GPU", style="magenta")
-        table.add_column("GPUs", justify="center")
-        table.add_column("CPU", justify="center")
-        table.add_column("RAM", justify="center")
-        table.add_column("Storage", justify="center")
-        table.add_column("$/hr", style="yellow")
-        table.add_column("Status")
-        
-        for m in machines:
-            status = "[green]Available[/green]" if m.available else "[red]In Use[/red]"
-            table.add_row(
-                m.id[:12] + "...",
-                m.gpu_type,
-                str(m.gpu_count),
-                f"{m.cpu_cores} cores",
-                f"{m.ram_gb} GB",
-                f"{m.storage_gb} GB",
-                f"${m.hourly_price:.2f}",
-                status
-            )
-        
-        console.print(table)
+    client = get_client()
+    machines = client.list_machines(gpu_type=gpu)
+    
+    if as_json:
+        data = [{"id": m.id, "gpu_type": m.gpu_type, "gpu_count": m.gpu_count,
+                "hourly_price": m.hourly_price, "available": m.available} for m in machines]
+        _echo_json(data)
+        return
+
+    from rich.table import Table
+    console = get_console()
+    
+    if not machines:
+        console.print("[yellow]No machines found.[/yellow]")
+        return
+    
+    table = Table(title="Available Machines", show_edge=False, show_lines=False, pad_edge=False)
+    table.add_column("ID", style="cyan", no_wrap=True, overflow="ignore")
+    table.add_column("GPU", style="magenta", no_wrap=True, overflow="ignore")
+    table.add_column("GPUs", justify="center", no_wrap=True, overflow="ignore")
+    table.add_column("CPU", justify="center", no_wrap=True, overflow="ignore")
+    table.add_column("RAM", justify="center", no_wrap=True, overflow="ignore")
+    table.add_column("Storage", justify="center", no_wrap=True, overflow="ignore")
+    table.add_column("$/hr", style="yellow", no_wrap=True, overflow="ignore")
+    table.add_column("Status", no_wrap=True, overflow="ignore")
+    
+    add = table.add_row
+    for m in machines:
+        status = "[green]Available[/green]" if m.available else "[red]In Use[/red]"
+        add(
+            m.id[:12] + "...",
+            m.gpu_type,
+            str(m.gpu_count),
+            f"{m.cpu_cores} cores",
+            f"{m.ram_gb} GB",
+            f"{m.storage_gb} GB",
+            f"${m.hourly_price:.2f}",
+            status
+        )
+    
+    console.print(table)
 
 
 # ==================== ACCOUNT COMMANDS ====================
@@ -448,31 +573,41 @@ def account():
 @account.command("balance")
 def account_balance():
     """Show your account balance."""
-    with get_client() as client:
-        try:
-            balance = client.get_balance()
-            console.print(f"[green]Account Balance:[/green] ${balance:.2f}")
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    console = get_console()
+    client = get_client()
+    try:
+        balance = client.get_balance()
+        console.print(f"[green]Account Balance:[/green] ${balance:.2f}")
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
 
 
 @account.command("info")
-def account_info():
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def account_info(as_json: bool):
     """Show account information."""
-    with get_client() as client:
-        try:
-            info = client.get_account_info()
-            
-            panel = Panel(
-                "\n".join([f"[cyan]{k}:[/cyan] {v}" for k, v in info.items()]),
-                title="Account Information",
-                border_style="green"
-            )
-            console.print(panel)
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
+    client = get_client()
+    try:
+        info = client.get_account_info()
+    except Exception as e:
+        get_console().print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    if as_json:
+        _echo_json(info)
+        return
+    if not sys.stdout.isatty():
+        _echo_fields(info)
+        return
+
+    from rich.panel import Panel
+    panel = Panel(
+        "\n".join([f"[cyan]{k}:[/cyan] {v}" for k, v in info.items()]),
+        title="Account Information",
+        border_style="green"
+    )
+    get_console().print(panel)
 
 
 # ==================== CONFIG COMMAND ====================
@@ -480,6 +615,7 @@ def account_info():
 @cli.command()
 def config():
     """Show current configuration."""
+    console = get_console()
     try:
         cfg = Config.load()
         console.print("[green]Configuration loaded successfully![/green]")
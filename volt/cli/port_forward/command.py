@@ -1,53 +1,316 @@
 """Port forward command implementation."""
 
+import errno
+import os
+import selectors
 import socket
-import threading
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
 import click
 
-from lium.sdk import Lium, PodInfo
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli import ui
-from lium.cli.utils import handle_errors, parse_targets
+from lium.cli.utils import handle_errors, parse_targets, get_lium
+
 
+# Bytes read per recv() call
+BUFFER_SIZE = 65536
+# Stop reading from a socket while this much is still queued for its peer
+HIGH_WATER = 4 * BUFFER_SIZE
+# Forwarded connections served at once; further clients wait in the listen backlog
+MAX_CONNECTIONS = 64
+# Linux: move bytes socket -> pipe -> socket in the kernel with splice(2)
+SPLICE = hasattr(os, "splice") and hasattr(fcntl, "F_SETPIPE_SZ")
 
-def get_port_mapping(pod: PodInfo, internal_port: int) -> Optional[int]:
+
+def get_port_mapping(pod: "PodInfo", internal_port: int) -> Optional[int]:
     """Get the external port for an internal port."""
     if not pod.ports:
         return None
     return pod.ports.get(str(internal_port))
 
 
-def forward_connection(client_sock: socket.socket, remote_host: str, remote_port: int):
-    """Forward data between client and remote."""
-    try:
+class Forwarder:
+    """Forward every accepted connection to the remote from one selector loop.
+
+    Each client/remote socket pair is non-blocking and multiplexed on a
+    single selector, with per-socket write buffers for backpressure,
+    instead of two blocking threads per connection. On Linux the write
+    buffer is a pipe filled and drained with splice(2), so forwarded
+    bytes are never copied into userland.
+    """
+
+    def __init__(self, server: socket.socket, remote_host: str, remote_port: int):
+        self.server = server
+        self.remote_addr = (remote_host, remote_port)
+        self.selector = selectors.DefaultSelector()
+        self.peer: Dict[socket.socket, socket.socket] = {}
+        self.pending: Dict[socket.socket, bytearray] = {}
+        # Splice pipe per destination socket: (read fd, write fd, capacity), and bytes in it
+        self.pipes: Dict[socket.socket, Tuple[int, int, int]] = {}
+        self.piped: Dict[socket.socket, int] = {}
+        self.connecting: Set[socket.socket] = set()
+        # Sockets that reached EOF, and sockets whose write side was shut down after it
+        self.eof: Set[socket.socket] = set()
+        self.shut: Set[socket.socket] = set()
+
+        server.setblocking(False)
+        self.selector.register(server, selectors.EVENT_READ)
+
+    def run(self) -> None:
+        """Serve connections until interrupted."""
+        while True:
+            self.poll()
+
+    def poll(self, timeout: Optional[float] = None) -> None:
+        """Wait up to timeout for socket events and handle one batch of them."""
+        for key, mask in self.selector.select(timeout):
+            sock = key.fileobj
+            if sock is self.server:
+                self._accept()
+                continue
+            if sock not in self.peer:
+                # Closed earlier in this batch along with its peer
+                continue
+            if mask & selectors.EVENT_WRITE:
+                self._on_writable(sock)
+            if mask & selectors.EVENT_READ and sock in self.peer:
+                self._on_readable(sock)
+
+    def close(self) -> None:
+        """Close all forwarded connections."""
+        for sock in list(self.peer):
+            self._close_pair(sock)
+        self.selector.close()
+
+    def _accept(self) -> None:
+        try:
+            client_sock, _ = self.server.accept()
+        except BlockingIOError:
+            return
+
         remote_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        remote_sock.connect((remote_host, remote_port))
+        for sock in (client_sock, remote_sock):
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        err = remote_sock.connect_ex(self.remote_addr)
+        if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+            ui.dim(f"Connection error: {os.strerror(err)}")
+            client_sock.close()
+            remote_sock.close()
+            return
+
+        self.peer[client_sock] = remote_sock
+        self.peer[remote_sock] = client_sock
+        if len(self.peer) >= 2 * MAX_CONNECTIONS:
+            ui.debug(f"{MAX_CONNECTIONS} connections open, pausing accept")
+            self.selector.unregister(self.server)
+        self.pending[client_sock] = bytearray()
+        self.pending[remote_sock] = bytearray()
+        if SPLICE:
+            self._open_pipes(client_sock, remote_sock)
+        self.connecting.add(remote_sock)
+        self._update(client_sock)
+        self._update(remote_sock)
+
+    def _open_pipes(self, *socks: socket.socket) -> None:
+        """Create a splice pipe per socket, keeping the bytearray path if that fails."""
+        for sock in socks:
+            try:
+                r, w = os.pipe()
+            except OSError:
+                return
+            try:
+                fcntl.fcntl(w, fcntl.F_SETPIPE_SZ, HIGH_WATER)
+            except OSError:
+                pass
+            self.pipes[sock] = (r, w, fcntl.fcntl(w, fcntl.F_GETPIPE_SZ))
+            self.piped[sock] = 0
+
+    def _on_readable(self, sock: socket.socket) -> None:
+        dst = self.peer[sock]
+        if dst in self.pipes:
+            self._on_readable_splice(sock, dst)
+            return
+
+        try:
+            data = sock.recv(BUFFER_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close_pair(sock)
+            return
+
+        if not data:
+            # Half-close: pass the EOF on once everything queued for dst is sent
+            self.eof.add(sock)
+            if self._finish(dst):
+                return
+        else:
+            self._send(dst, data)
+            if dst not in self.peer:
+                return
+
+        self._update(sock)
+        self._update(dst)
+
+    def _on_readable_splice(self, sock: socket.socket, dst: socket.socket) -> None:
+        _, w, capacity = self.pipes[dst]
+        try:
+            moved = os.splice(
+                sock.fileno(), w, min(BUFFER_SIZE, capacity - self.piped[dst]),
+                flags=os.SPLICE_F_MOVE | os.SPLICE_F_NONBLOCK
+            )
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close_pair(sock)
+            return
+
+        if not moved:
+            self.eof.add(sock)
+            if self._finish(dst):
+                return
+        else:
+            self.piped[dst] += moved
+            if not self._drain_pipe(dst):
+                return
 
-        def forward(src, dst):
+        self._update(sock)
+        self._update(dst)
+
+    def _drain_pipe(self, dst: socket.socket) -> bool:
+        """Splice queued bytes from dst's pipe into dst, returns False if the pair was closed."""
+        if dst in self.connecting or not self.piped[dst]:
+            return True
+        r, _, _ = self.pipes[dst]
+        try:
+            self.piped[dst] -= os.splice(
+                r, dst.fileno(), self.piped[dst],
+                flags=os.SPLICE_F_MOVE | os.SPLICE_F_NONBLOCK
+            )
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._close_pair(dst)
+            return False
+        return True
+
+    def _on_writable(self, sock: socket.socket) -> None:
+        if sock in self.connecting:
+            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err:
+                ui.dim(f"Connection error: {os.strerror(err)}")
+                self._close_pair(sock)
+                return
+            self.connecting.discard(sock)
+
+        buf = self.pending[sock]
+        if sock in self.pipes:
+            if not self._drain_pipe(sock):
+                return
+        elif buf:
             try:
-                while True:
-                    data = src.recv(4096)
-                    if not data:
-                        break
-                    dst.sendall(data)
-            except:
+                sent = sock.send(buf)
+                del buf[:sent]
+            except BlockingIOError:
                 pass
-            finally:
-                try:
-                    src.close()
-                    dst.close()
-                except:
-                    pass
-
-        t1 = threading.Thread(target=forward, args=(client_sock, remote_sock), daemon=True)
-        t2 = threading.Thread(target=forward, args=(remote_sock, client_sock), daemon=True)
-        t1.start()
-        t2.start()
-        t1.join()
-        t2.join()
-    except Exception as e:
-        ui.dim(f"Connection error: {e}")
-        client_sock.close()
+            except OSError:
+                self._close_pair(sock)
+                return
+
+        if self._finish(sock):
+            return
+
+        self._update(sock)
+        self._update(self.peer[sock])
+
+    def _send(self, dst: socket.socket, data: bytes) -> None:
+        """Send directly when nothing is queued, buffering whatever is left."""
+        buf = self.pending[dst]
+        if not buf and dst not in self.connecting:
+            try:
+                data = data[dst.send(data):]
+            except BlockingIOError:
+                pass
+            except OSError:
+                self._close_pair(dst)
+                return
+        buf += data
+
+    def _finish(self, sock: socket.socket) -> bool:
+        """Shut down sock's write side once its peer hit EOF and nothing is queued.
+
+        Returns True if the pair was closed because both directions are done.
+        """
+        if sock in self.connecting or self._queued(sock) or self.peer[sock] not in self.eof:
+            return False
+
+        if sock not in self.shut:
+            self.shut.add(sock)
+            try:
+                sock.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+        if sock in self.eof and self.peer[sock] in self.shut:
+            self._close_pair(sock)
+            return True
+        return False
+
+    def _queued(self, sock: socket.socket) -> int:
+        """Bytes waiting to be written to sock."""
+        return len(self.pending[sock]) + self.piped.get(sock, 0)
+
+    def _has_room(self, sock: socket.socket) -> bool:
+        """Whether more data may be queued for sock."""
+        if sock in self.pipes:
+            return self.piped[sock] < self.pipes[sock][2]
+        return len(self.pending[sock]) < HIGH_WATER
+
+    def _update(self, sock: socket.socket) -> None:
+        """Register interest in the events a socket can currently make progress on."""
+        events = 0
+        if (sock not in self.connecting and sock not in self.eof
+                and self._has_room(self.peer[sock])):
+            events |= selectors.EVENT_READ
+        if self._queued(sock) or sock in self.connecting:
+            events |= selectors.EVENT_WRITE
+
+        registered = sock in self.selector.get_map()
+        if events and registered:
+            self.selector.modify(sock, events)
+        elif events:
+            self.selector.register(sock, events)
+        elif registered:
+            self.selector.unregister(sock)
+
+    def _close_pair(self, sock: socket.socket) -> None:
+        paused = len(self.peer) >= 2 * MAX_CONNECTIONS
+        for s in (sock, self.peer.get(sock)):
+            if s is None or s not in self.peer:
+                continue
+            if s in self.selector.get_map():
+                self.selector.unregister(s)
+            self.peer.pop(s, None)
+            self.pending.pop(s, None)
+            self.piped.pop(s, None)
+            for fd in self.pipes.pop(s, ())[:2]:
+                os.close(fd)
+            self.connecting.discard(s)
+            self.eof.discard(s)
+            self.shut.discard(s)
+            s.close()
+
+        if paused and len(self.peer) < 2 * MAX_CONNECTIONS and self.server not in self.selector.get_map():
+            self.selector.register(self.server, selectors.EVENT_READ)
 
 
 @click.command("port-forward")
@@ -74,7 +337,7 @@ def port_forward_command(target: str, port: int, local_port: Optional[int]):
     if local_port is None:
         local_port = port
 
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
@@ -111,22 +374,19 @@ def port_forward_command(target: str, port: int, local_port: Optional[int]):
     server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
+    forwarder = None
     try:
         server.bind(("127.0.0.1", local_port))
         server.listen(5)
 
-        while True:
-            client_sock, addr = server.accept()
-            thread = threading.Thread(
-                target=forward_connection,
-                args=(client_sock, host, external_port),
-                daemon=True
-            )
-            thread.start()
+        forwarder = Forwarder(server, host, external_port)
+        forwarder.run()
 
     except KeyboardInterrupt:
         ui.dim("\nPort forwarding stopped")
     except OSError as e:
         ui.error(f"Failed to bind to port {local_port}: {e}")
     finally:
+        if forwarder:
+            forwarder.close()
         server.close()
@@ -3,9 +3,8 @@
 from typing import Optional
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
+from lium.cli.utils import handle_errors, ensure_config, find_pod, get_lium
 from . import display
 from .actions import GetPodsAction
 
@@ -19,7 +18,7 @@ def ps_command(pod_id: Optional[str]):
     ensure_config()
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     ctx = {"lium": lium}
 
     action = GetPodsAction()
@@ -38,7 +37,7 @@ def ps_command(pod_id: Optional[str]):
 
     # Filter by pod_id if provided
     if pod_id:
-        pod = next((p for p in pods if p.id == pod_id or p.huid == pod_id or p.name == pod_id), None)
+        pod = find_pod(pod_id, pods)
         if pod:
             pods = [pod]
         else:
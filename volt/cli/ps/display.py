@@ -1,10 +1,11 @@
 """Display formatting logic for ps command."""
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 from rich.table import Table
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import console
 
 
@@ -81,7 +82,7 @@ def format_header(pod_count: int) -> str:
     return f"Pods  ({pod_count} active)"
 
 
-def build_pods_table(pods: List[PodInfo], short: bool = False) -> tuple[Table | None, str]:
+def build_pods_table(pods: List["PodInfo"], short: bool = False) -> tuple[Table | None, str]:
     """Build pods table, returns (table, header)."""
 
     if not pods:
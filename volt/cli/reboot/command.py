@@ -3,9 +3,8 @@
 from typing import Optional
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors
+from lium.cli.utils import handle_errors, get_lium
 from . import validation, parsing
 from .actions import RebootPodsAction
 
@@ -25,7 +24,7 @@ def reboot_command(targets: Optional[str], all: bool, volume_id: Optional[str]):
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
@@ -1,15 +1,16 @@
 """Parsing logic for reboot command."""
 
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import parse_targets
 
 
 def parse(
     targets: str | None,
     all_flag: bool,
-    all_pods: List[PodInfo]
+    all_pods: List["PodInfo"]
 ) -> tuple[dict | None, str | None]:
     """Parse reboot command inputs, returns (parsed_data_dict, error_message)."""
 
@@ -3,9 +3,8 @@
 from typing import Optional
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors
+from lium.cli.utils import handle_errors, get_lium
 from . import validation, parsing
 from .actions import RemovePodsAction, ScheduleRemovalAction
 
@@ -26,7 +25,7 @@ def rm_command(targets: Optional[str], all: bool, in_duration: Optional[str], at
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
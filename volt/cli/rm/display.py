@@ -1,12 +1,13 @@
 """Display formatting logic for rm command."""
 
 from datetime import datetime, timezone
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 
 
-def calculate_pod_cost(pod: PodInfo) -> float:
+def calculate_pod_cost(pod: "PodInfo") -> float:
     """Calculate total cost of a pod since creation.
 
     Args:
@@ -33,7 +34,7 @@ def calculate_pod_cost(pod: PodInfo) -> float:
         return 0.0
 
 
-def format_pods_for_removal(pods: List[PodInfo], show_cost: bool = True) -> str:
+def format_pods_for_removal(pods: List["PodInfo"], show_cost: bool = True) -> str:
     """Format pods for removal preview.
 
     Args:
@@ -61,7 +62,7 @@ def format_pods_for_removal(pods: List[PodInfo], show_cost: bool = True) -> str:
     return "\n".join(lines)
 
 
-def format_pods_for_scheduled_removal(pods: List[PodInfo], termination_time: datetime) -> str:
+def format_pods_for_scheduled_removal(pods: List["PodInfo"], termination_time: datetime) -> str:
     """Format pods for scheduled removal preview.
 
     Args:
@@ -2,9 +2,10 @@
 
 import re
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import parse_targets
 
 
@@ -102,7 +103,7 @@ def parse_time_spec(time_spec: str) -> tuple[datetime | None, str | None]:
 def parse(
     targets: str | None,
     all_flag: bool,
-    all_pods: List[PodInfo],
+    all_pods: List["PodInfo"],
     in_duration: str | None,
     at_time: str | None
 ) -> tuple[dict | None, str | None]:
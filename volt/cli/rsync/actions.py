@@ -1,10 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
 from lium.cli import ui
 
+# Pods synced concurrently
+MAX_WORKERS = 32
+
+# Installs rsync only when it is missing; output is discarded on the pod so
+# none of the apt-get text travels back over SSH
+ENSURE_RSYNC = "command -v rsync >/dev/null || (apt-get update -qq && apt-get install -y rsync -qq) >/dev/null 2>&1"
+
 
 class RsyncPodsAction:
     """Rsync files to pods."""
@@ -16,34 +25,37 @@ class RsyncPodsAction:
         local_dir: Path = ctx["local_dir"]
         remote_path: str = ctx["remote_path"]
 
-        failed_huids = []
-
-        for pod in pods:
-            try:
-                # Check if rsync is installed on pod
-                check_result = lium.exec(pod, command="which rsync")
-                if not check_result.get("success"):
-                    ui.debug(f"Installing rsync on {pod.huid}")
-                    install_result = lium.exec(
-                        pod,
-                        command="apt-get update -qq && apt-get install -y rsync -qq",
-                    )
-                    if not install_result.get("success"):
-                        ui.debug(f"Failed to install rsync on {pod.huid}")
-                        failed_huids.append(pod.huid)
-                        continue
-
-                # Format path for directories
-                local_formatted = str(local_dir) + ('/' if local_dir.is_dir() else '')
-
-                # Rsync
-                lium.rsync(pod, local=local_formatted, remote=remote_path)
-
-            except Exception as e:
-                ui.debug(f"Failed to rsync to {pod.huid}: {e}")
-                failed_huids.append(pod.huid)
+        # Format path for directories
+        local_formatted = str(local_dir) + ('/' if local_dir.is_dir() else '')
+
+        failed = set()
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pods)) or 1) as executor:
+            futures = {
+                executor.submit(self._rsync_one, lium, pod, local_formatted, remote_path): pod
+                for pod in pods
+            }
+            for future in as_completed(futures):
+                if not future.result():
+                    failed.add(futures[future].huid)
+
+        failed_huids = [pod.huid for pod in pods if pod.huid in failed]
 
         return ActionResult(
             ok=(len(failed_huids) == 0),
             data={"failed_huids": failed_huids}
         )
+
+    def _rsync_one(self, lium: "Lium", pod: "PodInfo", local: str, remote_path: str) -> bool:
+        """Ensure rsync is installed and sync to one pod, returns success."""
+        try:
+            # Check and install in a single SSH round-trip
+            if not lium.exec(pod, command=ENSURE_RSYNC).get("success"):
+                ui.debug(f"Failed to install rsync on {pod.huid}")
+                return False
+
+            lium.rsync(pod, local=local, remote=remote_path)
+            return True
+
+        except Exception as e:
+            ui.debug(f"Failed to rsync to {pod.huid}: {e}")
+            return False
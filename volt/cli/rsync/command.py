@@ -3,9 +3,8 @@
 from typing import Optional
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors
+from lium.cli.utils import handle_errors, get_lium
 from . import validation, parsing
 from .actions import RsyncPodsAction
 
@@ -25,7 +24,7 @@ def rsync_command(targets: str, local_path: str, remote_path: Optional[str]):
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
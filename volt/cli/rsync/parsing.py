@@ -1,15 +1,16 @@
 """Parsing logic for rsync command."""
 
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import parse_targets
 
 
 def parse(
     targets: str,
-    all_pods: List[PodInfo],
+    all_pods: List["PodInfo"],
     local_path: str,
     remote_path: str | None
 ) -> tuple[dict | None, str | None]:
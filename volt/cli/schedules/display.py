@@ -1,10 +1,11 @@
 """Display formatting logic for schedules command."""
 
 from datetime import datetime, timezone
-from typing import List
+from typing import TYPE_CHECKING, List
 from rich.table import Table
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import console, mid_ellipsize
 
 
@@ -18,7 +19,7 @@ def format_tip() -> str:
     return f"Tip: {console.get_styled('lium schedules rm <index>', 'success')} {console.get_styled('# cancel scheduled termination', 'dim')}"
 
 
-def build_schedules_table(pods: List[PodInfo]) -> tuple[Table | None, str, str]:
+def build_schedules_table(pods: List["PodInfo"]) -> tuple[Table | None, str, str]:
     """Build schedules table, returns (table, header, tip)."""
 
     # Filter to only pods with scheduled terminations
@@ -2,9 +2,8 @@
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors
+from lium.cli.utils import handle_errors, get_lium
 from .. import display
 
 
@@ -13,7 +12,7 @@ from .. import display
 def schedules_list_command():
     """List all pods with scheduled terminations."""
 
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading scheduled terminations", lambda: lium.ps())
 
     # Build table
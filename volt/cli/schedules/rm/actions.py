@@ -1,9 +1,14 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List
 
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
 from lium.cli import ui
 
+# Cancellations sent concurrently
+MAX_WORKERS = 16
+
 
 class CancelSchedulesAction:
     """Cancel scheduled terminations."""
@@ -13,14 +18,18 @@ class CancelSchedulesAction:
         pods: List[PodInfo] = ctx["pods"]
         lium: Lium = ctx["lium"]
 
-        failed_huids = []
-
-        for pod in pods:
+        def cancel(pod: "PodInfo") -> bool:
             try:
                 lium.cancel_scheduled_termination(pod)
+                return True
             except Exception as e:
                 ui.debug(f"Failed to cancel schedule for {pod.huid}: {e}")
-                failed_huids.append(pod.huid)
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pods)) or 1) as executor:
+            results = list(executor.map(cancel, pods))
+
+        failed_huids = [pod.huid for pod, ok in zip(pods, results) if not ok]
 
         return ActionResult(
             ok=(len(failed_huids) == 0),
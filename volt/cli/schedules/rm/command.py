@@ -2,9 +2,8 @@
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors
+from lium.cli.utils import handle_errors, get_lium
 from . import validation, parsing
 from .actions import CancelSchedulesAction
 
@@ -22,7 +21,7 @@ def schedules_rm_command(indices: str):
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading scheduled terminations", lambda: lium.ps())
 
     if not all_pods:
@@ -1,11 +1,12 @@
 """Parsing logic for schedules rm command."""
 
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 
 
-def parse(indices: str, all_pods: List[PodInfo]) -> tuple[dict | None, str | None]:
+def parse(indices: str, all_pods: List["PodInfo"]) -> tuple[dict | None, str | None]:
     """Parse schedules rm command inputs, returns (parsed_data_dict, error_message)."""
 
     # Filter to only pods with scheduled terminations
@@ -1,8 +1,9 @@
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
 from lium.cli import ui
 
 
@@ -2,9 +2,10 @@
 
 import os
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import parse_targets
 
 
@@ -13,7 +14,7 @@ def parse(
     source_path: str,
     destination_path: str | None,
     download: bool,
-    all_pods: List[PodInfo]
+    all_pods: List["PodInfo"]
 ) -> tuple[dict | None, str]:
     """Parse scp command arguments."""
 
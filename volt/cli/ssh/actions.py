@@ -1,9 +1,16 @@
+import os
+import shlex
 import subprocess
+import sys
+from typing import TYPE_CHECKING, List
 
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
 from lium.cli import ui
 
+SSH_OPTIONS = ["-o", "StrictHostKeyChecking=no", "-o", "UserKnownHostsFile=/dev/null"]
+
 
 class SshAction:
     """Execute SSH connection."""
@@ -18,10 +25,23 @@ class SshAction:
         except ValueError:
             ssh_cmd = pod.ssh_cmd
 
-        ssh_cmd += " -o StrictHostKeyChecking=no -o UserKnownHostsFile=/dev/null"
+        argv = shlex.split(ssh_cmd) + SSH_OPTIONS
+
+        if sys.platform == 'win32':
+            return self._run_ssh(argv)
+
+        # The session is the last thing the command does, so replace this process with ssh
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            os.execvp(argv[0], argv)
+        except OSError:
+            return self._run_ssh(argv)
 
+    def _run_ssh(self, argv: List[str]) -> ActionResult:
+        """Run ssh as a child process, without a shell."""
         try:
-            result = subprocess.run(ssh_cmd, shell=True, check=False)
+            result = subprocess.run(argv, check=False)
 
             if result.returncode != 0 and result.returncode != 255:
                 return ActionResult(
@@ -29,7 +49,7 @@ class SshAction:
                     data={"exit_code": result.returncode}
                 )
 
-            return ActionResult(ok=True, data={})
+            return ActionResult.OK_EMPTY
 
         except KeyboardInterrupt:
             return ActionResult(ok=False, data={}, error="SSH session interrupted")
@@ -1,24 +1,26 @@
 """SSH command implementation."""
 
+import shlex
 import shutil
 import subprocess
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 import click
 
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli import ui
-from lium.cli.utils import handle_errors, parse_targets
+from lium.cli.utils import handle_errors, parse_targets, get_lium
 from . import validation, parsing
 from .actions import SshAction
 
 
-def get_ssh_method_and_pod(target: str) -> Tuple[str, PodInfo]:
+def get_ssh_method_and_pod(target: str) -> Tuple[str, "PodInfo"]:
     """Helper function that check method for SSH."""
     if not shutil.which("ssh"):
         ui.error("Error: 'ssh' command not found. Please install an SSH client.")
         return None, None
 
-    lium = Lium()
+    lium = get_lium()
     all_pods = lium.ps()
 
     pods = parse_targets(target, all_pods)
@@ -40,10 +42,10 @@ def get_ssh_method_and_pod(target: str) -> Tuple[str, PodInfo]:
         return ssh_cmd, pod
 
 
-def ssh_to_pod(ssh_cmd: str, pod: PodInfo) -> None:
+def ssh_to_pod(ssh_cmd: str, pod: "PodInfo") -> None:
     """Helper function to SSH to a pod."""
     try:
-        result = subprocess.run(ssh_cmd, shell=True, check=False)
+        result = subprocess.run(shlex.split(ssh_cmd), check=False)
 
         if result.returncode != 0 and result.returncode != 255:
             ui.dim(f"\nSSH session ended with exit code {result.returncode}")
@@ -77,7 +79,7 @@ def ssh_command(target: str):
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
@@ -3,9 +3,8 @@
 from typing import Optional
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors
+from lium.cli.utils import handle_errors, get_lium
 from . import display
 from .actions import GetTemplatesAction
 
@@ -16,7 +15,7 @@ from .actions import GetTemplatesAction
 def templates_command(search: Optional[str]):
     """List available Docker templates and images."""
     # Load data
-    lium = Lium()
+    lium = get_lium()
     ctx = {"lium": lium, "search": search}
 
     action = GetTemplatesAction()
@@ -1,10 +1,11 @@
 """Templates display formatting."""
 
-from typing import List
+from typing import TYPE_CHECKING, List
 from rich.table import Table
 from rich.text import Text
 
-from lium.sdk import Template
+if TYPE_CHECKING:
+    from lium.sdk import Template
 from lium.cli import ui
 
 
@@ -17,7 +18,7 @@ def status_icon(status: str) -> str:
         return ui.styled("?", 'dim')
 
 
-def build_templates_table(templates: List[Template]) -> tuple[Table, str]:
+def build_templates_table(templates: List["Template"]) -> tuple[Table, str]:
     header = f"{Text('Templates', style='bold')}  ({len(templates)} shown)"
 
     table = Table(
@@ -10,7 +10,7 @@ from contextlib import contextmanager
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
-from lium.cli.utils import console, loading_status
+from lium.cli.utils import console, delayed_loading_status, loading_status
 
 T = TypeVar("T")
 
@@ -36,12 +36,13 @@ def loading(message: str):
         yield
 
 
-def load(message: str, fn: Callable[[], T]) -> T:
+def load(message: str, fn: Callable[[], T], min_duration: float = 0.1) -> T:
     """Execute a function with loading status.
 
     Args:
         message: Loading message to display
         fn: Function to execute
+        min_duration: Seconds before the spinner appears; faster calls show none
 
     Returns:
         Result of the function
@@ -49,7 +50,10 @@ def load(message: str, fn: Callable[[], T]) -> T:
     Example:
         pods = ui.load("Loading pods", lambda: lium.ps())
     """
-    with loading_status(message, ""):
+    if min_duration <= 0:
+        with loading_status(message, ""):
+            return fn()
+    with delayed_loading_status(message, min_duration):
         return fn()
 
 
@@ -1,16 +1,24 @@
-from typing import Optional, Dict, List
+from typing import TYPE_CHECKING, Optional, Dict, List
 import time
 
 from lium.cli.actions import ActionResult
-from lium.sdk import ExecutorInfo, Template, PodInfo, Lium
+if TYPE_CHECKING:
+    from lium.sdk import ExecutorInfo, Template, PodInfo, Lium
 from lium.cli.utils import (
     calculate_pareto_frontier,
     resolve_executor_indices,
     get_pytorch_template_id,
     wait_ready_no_timeout,
+    fetch_pod,
 )
 
 
+# Jupyter install polling: starts short and backs off, capped per poll
+JUPYTER_MAX_WAIT = 120
+JUPYTER_POLL_START = 0.5
+JUPYTER_POLL_MAX = 8.0
+
+
 class ResolveExecutorAction:
 
     def execute(self, ctx: dict) -> ActionResult:
@@ -41,7 +49,11 @@ class ResolveExecutorAction:
                         error=f"Executor {executor.huid} has insufficient ports (available: {available}, required: {ports})"
                     )
             else:
-                executors = lium.ls(gpu_type=gpu)
+                from lium.cli.ls import _cache
+                executors = _cache.get_or_fetch(
+                    (gpu, None, None, None, None),
+                    lambda: lium.ls(gpu_type=gpu),
+                )
 
                 if count:
                     executors = [e for e in executors if e.gpu_count == count]
@@ -258,17 +270,15 @@ class InstallJupyterAction:
 
             lium.install_jupyter(pod, jupyter_internal_port=jupyter_port)
 
-            max_wait = 120
-            wait_interval = 3
-            elapsed = 0
             pod_id = pod.id
+            deadline = time.monotonic() + JUPYTER_MAX_WAIT
+            interval = JUPYTER_POLL_START
 
-            while elapsed < max_wait:
-                time.sleep(wait_interval)
-                elapsed += wait_interval
+            while time.monotonic() < deadline:
+                time.sleep(interval)
+                interval = min(interval * 1.5, JUPYTER_POLL_MAX)
 
-                all_pods = lium.ps()
-                updated_pod = next((p for p in all_pods if p.id == pod_id or p.huid == pod_id or p.name == pod_id), None)
+                updated_pod = fetch_pod(lium, pod_id)
 
                 if updated_pod and hasattr(updated_pod, 'jupyter_installation_status'):
                     if updated_pod.jupyter_installation_status == "SUCCESS":
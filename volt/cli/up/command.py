@@ -1,22 +1,10 @@
 from typing import Optional, Tuple
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
+from lium.cli.utils import handle_errors, ensure_config, get_lium
 from lium.cli.completion import get_gpu_completions
 from . import validation, parsing
-from .actions import (
-    ResolveExecutorAction,
-    ResolveTemplateAction,
-    CreateEphemeralTemplateAction,
-    CreateVolumeAction,
-    RentPodAction,
-    WaitReadyAction,
-    ScheduleTerminationAction,
-    InstallJupyterAction,
-    PrepareSSHAction,
-)
 
 
 @click.command("up")
@@ -88,8 +76,6 @@ def up_command(
       lium up --gpu A4000 --image myimg --entrypoint /bin/sh --cmd "-c 'echo hi'"
       lium up --gpu A4000 --image myimg --internal-ports 22,8000,8080
     """
-    ensure_config()
-
     # Check if we're in docker-run mode
     docker_run_mode = image is not None
 
@@ -115,7 +101,43 @@ def up_command(
     volume_id = parsed.get("volume_id")
     volume_create_params = parsed.get("volume_create_params")
 
-    lium = Lium()
+    # Parse internal ports for docker-run mode (default to [22] if not specified)
+    ports_list = [22]
+    if docker_run_mode and internal_ports:
+        ports_list, error = validation.parse_internal_ports(internal_ports)
+        if error:
+            ui.error(error)
+            return
+
+    # Local checks are done; only now import the actions and load config and
+    # the SDK client (the imports also keep `--help` and completion light)
+    from concurrent.futures import ThreadPoolExecutor
+    from .actions import (
+        ResolveExecutorAction,
+        ResolveTemplateAction,
+        CreateEphemeralTemplateAction,
+        CreateVolumeAction,
+        RentPodAction,
+        WaitReadyAction,
+        ScheduleTerminationAction,
+        InstallJupyterAction,
+        PrepareSSHAction,
+    )
+
+    ensure_config()
+    lium = get_lium()
+
+    # Runs steps that do not depend on each other alongside the main flow
+    background = ThreadPoolExecutor(max_workers=2)
+
+    # An explicit template does not depend on the executor, so fetch it
+    # while the executor is being resolved
+    template_future = None
+    if template_id and not docker_run_mode:
+        template_future = background.submit(
+            ResolveTemplateAction().execute,
+            {"lium": lium, "template_id": template_id, "executor": None},
+        )
 
     action = ResolveExecutorAction()
     result = ui.load(
@@ -145,20 +167,17 @@ def up_command(
         if not ui.confirm(confirm_msg):
             return
 
+    # The new volume only needs its own parameters, so create it while the
+    # template is resolved or created
+    volume_future = None
+    if volume_create_params:
+        volume_future = background.submit(
+            CreateVolumeAction().execute,
+            {"lium": lium, "volume_create_params": volume_create_params},
+        )
+
     # Resolve or create template
     if docker_run_mode:
-        # Parse internal ports (default to [22] if not specified)
-        ports_list = [22]
-        if internal_ports:
-            try:
-                ports_list = [int(p.strip()) for p in internal_ports.split(",")]
-                # Ensure port 22 is included for SSH access
-                if 22 not in ports_list:
-                    ports_list.insert(0, 22)
-            except ValueError:
-                ui.error("Invalid port format. Use comma-separated integers (e.g., 22,8000,8080)")
-                return
-
         action = CreateEphemeralTemplateAction()
         result = ui.load(
             "Creating template",
@@ -171,6 +190,8 @@ def up_command(
                 "ports": ports_list,
             })
         )
+    elif template_future:
+        result = template_future.result()
     else:
         action = ResolveTemplateAction()
         result = action.execute({
@@ -181,18 +202,25 @@ def up_command(
 
     if not result.ok:
         ui.error(result.error)
+        # Don't leave behind the volume created alongside the template
+        if volume_future:
+            volume_result = volume_future.result()
+            if volume_result.ok:
+                try:
+                    lium.volume_delete(volume_result.data["volume_id"])
+                except Exception:
+                    ui.dim(
+                        f"Volume '{volume_create_params['name']}' was created but could not be removed; "
+                        "delete it with 'lium volumes rm'"
+                    )
         return
 
     template = result.data["template"]
 
-    if volume_create_params:
-        action = CreateVolumeAction()
+    if volume_future:
         result = ui.load(
             f"Creating volume '{volume_create_params['name']}'",
-            lambda: action.execute({
-                "lium": lium,
-                "volume_create_params": volume_create_params
-            })
+            volume_future.result
         )
 
         if not result.ok:
@@ -236,20 +264,14 @@ def up_command(
 
     pod = result.data["pod"]
 
+    # Termination scheduling is independent of the Jupyter install, so overlap them
+    termination_future = None
     if termination_time:
-        action = ScheduleTerminationAction()
-        result = ui.load(
-            "Scheduling termination",
-            lambda: action.execute({
-                "lium": lium,
-                "pod": pod,
-                "termination_time": termination_time
-            })
+        termination_future = background.submit(
+            ScheduleTerminationAction().execute,
+            {"lium": lium, "pod": pod, "termination_time": termination_time},
         )
 
-        if not result.ok:
-            ui.error(result.error)
-
     if jupyter:
         action = InstallJupyterAction()
         result = ui.load(
@@ -264,8 +286,15 @@ def up_command(
         if not result.ok:
             ui.error(result.error)
 
+    if termination_future:
+        result = ui.load("Scheduling termination", termination_future.result)
+
+        if not result.ok:
+            ui.error(result.error)
+
     # Docker-run mode: stream logs instead of SSH
     if docker_run_mode:
+        from lium.cli.logs import display
         from lium.cli.logs.actions import StreamLogsAction
 
         ui.dim(f"Streaming logs from {pod_name}... (Ctrl+C to stop)")
@@ -274,8 +303,7 @@ def up_command(
         action = StreamLogsAction()
 
         try:
-            for line in action.execute(ctx):
-                click.echo(line)
+            display.write_lines(action.execute(ctx), follow=True)
         except KeyboardInterrupt:
             ui.dim("\nStopped following logs")
         return
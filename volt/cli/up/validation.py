@@ -1,6 +1,10 @@
 """Up command validation."""
 
-from typing import Optional, Tuple
+import re
+from typing import List, Optional, Tuple
+
+# Comma-separated port numbers, whitespace allowed around each
+_PORTS_RE = re.compile(r"\s*\d+\s*(?:,\s*\d+\s*)*")
 
 
 def validate(
@@ -40,10 +44,30 @@ def parse_env_vars(env_list: Tuple[str, ...]) -> Tuple[dict, Optional[str]]:
     """
     env_dict = {}
     for env_str in env_list:
-        if "=" not in env_str:
+        key, sep, value = env_str.partition("=")
+        if not sep:
             return {}, f"Invalid environment variable format: '{env_str}'. Use KEY=VALUE"
-        key, value = env_str.split("=", 1)
         if not key:
             return {}, f"Empty key in environment variable: '{env_str}'"
         env_dict[key] = value
     return env_dict, None
+
+
+def parse_internal_ports(spec: str) -> Tuple[List[int], Optional[str]]:
+    """Parse a comma-separated internal ports list.
+
+    Duplicates are dropped in order and SSH port 22 is always included first
+    when missing.
+
+    Args:
+        spec: Ports string like '22,8000,8080'
+
+    Returns:
+        (ports_list, error_message)
+    """
+    if not _PORTS_RE.fullmatch(spec):
+        return [], "Invalid port format. Use comma-separated integers (e.g., 22,8000,8080)"
+    ports = dict.fromkeys(int(port) for port in spec.split(","))
+    if 22 not in ports:
+        return [22, *ports], None
+    return list(ports), None
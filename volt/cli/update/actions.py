@@ -1,7 +1,9 @@
 import time
+from typing import TYPE_CHECKING
 
 from lium.cli.actions import ActionResult
-from lium.sdk import Lium, PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import Lium, PodInfo
 from lium.cli import ui
 
 
@@ -4,9 +4,8 @@ from typing import Optional
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors
+from lium.cli.utils import handle_errors, get_lium
 from . import validation, parsing
 from .actions import InstallJupyterAction
 
@@ -36,7 +35,7 @@ def update_command(target: str, jupyter: Optional[int]):
         return
 
     # Load data
-    lium = Lium()
+    lium = get_lium()
     all_pods = ui.load("Loading pods", lambda: lium.ps())
 
     if not all_pods:
@@ -1,12 +1,13 @@
 """Parsing logic for update command."""
 
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from lium.sdk import PodInfo
+if TYPE_CHECKING:
+    from lium.sdk import PodInfo
 from lium.cli.utils import parse_targets
 
 
-def parse(target: str, all_pods: List[PodInfo]) -> tuple[dict | None, str]:
+def parse(target: str, all_pods: List["PodInfo"]) -> tuple[dict | None, str]:
     """Parse update command arguments."""
 
     pods = parse_targets(target, all_pods)
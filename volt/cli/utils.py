@@ -1,13 +1,16 @@
 """CLI utilities and decorators."""
-from functools import wraps
+from functools import lru_cache, wraps
 from contextlib import contextmanager
-from typing import List, Dict, Any, Tuple, Optional, Callable, TypeVar
+from typing import TYPE_CHECKING, List, Dict, Any, Tuple, Optional, Callable, TypeVar
 import json
+import time
+import orjson
 from pathlib import Path
 from lium.cli.settings import config
 from datetime import datetime
 from rich.status import Status
-from lium.sdk import LiumError, ExecutorInfo, PodInfo,Lium
+if TYPE_CHECKING:
+    from lium.sdk import ExecutorInfo, PodInfo, Lium
 from .themed_console import ThemedConsole
 from dataclasses import dataclass
 from rich.prompt import Prompt
@@ -150,6 +153,39 @@ def loading_status(message: str, success_message: str = ""):
         status.stop()
 
 
+@contextmanager
+def delayed_loading_status(message: str, delay: float):
+    """Like loading_status, but only shows the spinner once delay seconds pass.
+
+    Work that finishes sooner never starts Rich's live display.
+    """
+    import threading
+
+    lock = threading.Lock()
+    state = {"done": False, "status": None}
+
+    def _show():
+        with lock:
+            if not state["done"]:
+                state["status"] = Status(f"{console.get_styled(message + '...', 'info')}", console=console)
+                state["status"].start()
+
+    timer = threading.Timer(delay, _show)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    except Exception as e:
+        console.error(f"✗ Failed: {e}")
+        raise
+    finally:
+        timer.cancel()
+        with lock:
+            state["done"] = True
+            if state["status"]:
+                state["status"].stop()
+
+
 def _update_spinner_display(step_prefix: str, message: str, start_time: float, running_flag):
     """Internal function to update spinner display with time."""
     import time
@@ -256,14 +292,17 @@ def handle_errors(func):
                 console.dim("Or set LIUM_API_KEY environment variable")
             else:
                 console.error(f"Error: {e}")
-        except LiumError as e:
-            console.error(f"Error: {e}")
         except Exception as e:
-            console.error(f"Unexpected error: {e}")
+            # Only failing commands pay for importing the SDK here
+            from lium.sdk import LiumError
+            if isinstance(e, LiumError):
+                console.error(f"Error: {e}")
+            else:
+                console.error(f"Unexpected error: {e}")
     return wrapper
 
 
-def extract_executor_metrics(executor: ExecutorInfo) -> Dict[str, float]:
+def extract_executor_metrics(executor: "ExecutorInfo") -> Dict[str, float]:
     """Extract relevant metrics from an executor for Pareto comparison."""
     specs = executor.specs or {}
     
@@ -297,13 +336,21 @@ def extract_executor_metrics(executor: ExecutorInfo) -> Dict[str, float]:
     }
 
 
+# Metrics to minimize (lower is better)
+_MINIMIZE_METRICS = frozenset({'price_per_gpu_hour'})
+
+# Priority metrics when prices are equal
+_PRIORITY_METRICS = ('total_bandwidth', 'location_score', 'net_down', 'net_up')
+
+# Below this many executors the pairwise Python loop is cheaper than NumPy setup
+_NUMPY_PARETO_MIN = 64
+_NUMPY_PARETO_BLOCK = 128
+
+
 def dominates(metrics_a: Dict[str, float], metrics_b: Dict[str, float]) -> bool:
     """Check if executor A dominates executor B in Pareto sense."""
-    # Metrics to minimize (lower is better)
-    minimize_metrics = {'price_per_gpu_hour'}
-    
-    # Priority metrics when prices are equal
-    priority_metrics = ['total_bandwidth', 'location_score', 'net_down', 'net_up']
+    minimize_metrics = _MINIMIZE_METRICS
+    priority_metrics = _PRIORITY_METRICS
     
     price_a = metrics_a.get('price_per_gpu_hour', float('inf'))
     price_b = metrics_b.get('price_per_gpu_hour', float('inf'))
@@ -364,13 +411,75 @@ def dominates(metrics_a: Dict[str, float], metrics_b: Dict[str, float]) -> bool:
     return at_least_one_better
 
 
-def calculate_pareto_frontier(executors: List[ExecutorInfo]) -> List[bool]:
+def _pareto_flags_numpy(metrics_list: List[Dict[str, float]]) -> List[bool]:
+    """Vectorized equivalent of the pairwise dominates() loop.
+
+    Compares a block of executors against all others at once, so the
+    O(N^2) pair checks run inside NumPy instead of the interpreter.
+    """
+    import numpy as np
+
+    keys = list(metrics_list[0])
+    values = np.array([[m[k] or 0 for k in keys] for m in metrics_list], dtype=float)
+
+    price_col = keys.index('price_per_gpu_hour')
+    priority_cols = [keys.index(k) for k in _PRIORITY_METRICS]
+    other_cols = [c for c in range(len(keys)) if c not in priority_cols]
+    # Flip minimized metrics so that higher is better everywhere
+    sign = np.array([-1.0 if k in _MINIMIZE_METRICS else 1.0 for k in keys])
+    oriented = values * sign
+
+    n = len(metrics_list)
+    is_pareto = np.empty(n, dtype=bool)
+    for start in range(0, n, _NUMPY_PARETO_BLOCK):
+        stop = min(start + _NUMPY_PARETO_BLOCK, n)
+        # Axis 0: dominated candidates (B), axis 1: potential dominators (A)
+        b = values[start:stop, None, :]
+        a = values[None, :, :]
+
+        # Standard Pareto domination when prices differ
+        ob, oa = oriented[start:stop, None, :], oriented[None, :, :]
+        standard = (oa >= ob).all(axis=2) & (oa > ob).any(axis=2)
+
+        # Equal prices: first significant priority metric decides,
+        # otherwise fall back to all remaining metrics
+        decided = np.zeros((stop - start, n), dtype=bool)
+        equal_price = np.zeros((stop - start, n), dtype=bool)
+        for col, metric in zip(priority_cols, _PRIORITY_METRICS):
+            val_a, val_b = a[..., col], b[..., col]
+            threshold = 0 if metric == 'location_score' else 0.1 * np.maximum(val_a, val_b)
+            wins = ~decided & (val_a > val_b + threshold)
+            losses = ~decided & (val_b > val_a + threshold)
+            equal_price |= wins
+            decided |= wins | losses
+        rest_a, rest_b = a[..., other_cols], b[..., other_cols]
+        equal_price |= ~decided & (rest_a >= rest_b).all(axis=2) & (rest_a > rest_b).any(axis=2)
+
+        # inf - inf (missing prices) gives NaN, which correctly compares unequal
+        with np.errstate(invalid='ignore'):
+            same_price = np.abs(a[..., price_col] - b[..., price_col]) < 0.01
+        dominated = np.where(same_price, equal_price, standard)
+        # An executor never dominates itself
+        dominated[np.arange(stop - start), np.arange(start, stop)] = False
+        is_pareto[start:stop] = ~dominated.any(axis=1)
+
+    return is_pareto.tolist()
+
+
+def calculate_pareto_frontier(executors: List["ExecutorInfo"]) -> List[bool]:
     """Calculate which executors are on the Pareto frontier.
     
     Returns a list of booleans indicating if each executor is Pareto-optimal.
     """
     # Extract metrics for all executors
     metrics_list = [extract_executor_metrics(e) for e in executors]
+
+    if len(metrics_list) >= _NUMPY_PARETO_MIN:
+        try:
+            return _pareto_flags_numpy(metrics_list)
+        except (ImportError, TypeError, ValueError):
+            # NumPy not installed ('fast' extra) or non-numeric specs
+            pass
     
     # Mark each executor as Pareto-optimal or not
     is_pareto = []
@@ -385,29 +494,51 @@ def calculate_pareto_frontier(executors: List[ExecutorInfo]) -> List[bool]:
     return is_pareto
 
 
-def store_executor_selection(executors: List[ExecutorInfo]) -> None:
-    """Store the last executor selection for index-based selection."""
+def store_executor_selection(executors: List["ExecutorInfo"], filters: Optional[Tuple] = None) -> None:
+    """Store the last executor selection for index-based selection.
+
+    ``filters`` records the listing filters so the stored executors can be
+    reused by load_executor_selection(); pass None when the list is partial.
+    """
     from lium.cli.settings import config
     
     selection_data = {
         'timestamp': datetime.now().isoformat(),
-        'executors': []
+        'ts': time.time(),
+        'filters': list(filters) if filters is not None else None,
+        # orjson serializes the executor dataclasses natively, no asdict() copy
+        'executors': executors
     }
     
-    for executor in executors:
-        selection_data['executors'].append({
-            'id': executor.id,
-            'huid': executor.huid,
-            'gpu_type': executor.gpu_type,
-            'gpu_count': executor.gpu_count,
-            'price_per_hour': executor.price_per_hour,
-            'location': executor.location.get('country', 'Unknown') if executor.location else 'Unknown'
-        })
-    
     # Store in config directory
     config_file = config.config_dir / "last_selection.json"
-    with open(config_file, 'w') as f:
-        json.dump(selection_data, f, indent=2)
+    with open(config_file, 'wb') as f:
+        f.write(orjson.dumps(selection_data, option=orjson.OPT_INDENT_2))
+
+
+def load_executor_selection(filters: Tuple, max_age: float = 60) -> Optional[Tuple[List["ExecutorInfo"], float]]:
+    """Load the stored executors if stored for the same filters within max_age seconds.
+
+    Returns (executors, timestamp) or None when missing, stale or for other filters.
+    """
+    from lium.sdk import ExecutorInfo
+    last_selection = get_last_executor_selection()
+    if not last_selection:
+        return None
+
+    ts = last_selection.get('ts')
+    if ts is None or time.time() - ts > max_age:
+        return None
+
+    if last_selection.get('filters') != list(filters):
+        return None
+
+    try:
+        executors = [ExecutorInfo(**data) for data in last_selection.get('executors', [])]
+    except TypeError:
+        return None
+
+    return executors, ts
 
 
 def get_last_executor_selection() -> Optional[Dict[str, Any]]:
@@ -417,9 +548,9 @@ def get_last_executor_selection() -> Optional[Dict[str, Any]]:
     config_file = config.config_dir / "last_selection.json"
     if config_file.exists():
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(config_file, 'rb') as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError):
             return None
     return None
 
@@ -580,12 +711,13 @@ def resolve_executor_indices(indices: List[str]) -> Tuple[List[str], Optional[st
     return resolved_ids, error_msg
 
 
-def parse_targets(targets: str, all_pods: List[PodInfo]) -> List[PodInfo]:
+def parse_targets(targets: str, all_pods: List["PodInfo"]) -> List["PodInfo"]:
     """Parse target specification and return matching pods."""
     if targets.lower() == "all":
         return all_pods
     
     selected = []
+    pods_by_key: Optional[Dict[str, PodInfo]] = None
     for target in targets.split(","):
         target = target.strip()
         
@@ -598,22 +730,38 @@ def parse_targets(targets: str, all_pods: List[PodInfo]) -> List[PodInfo]:
         except ValueError:
             pass
         
-        # Try as pod ID/name/huid
-        for pod in all_pods:
-            if target in (pod.id, pod.name, pod.huid):
-                selected.append(pod)
-                break
+        # Try as pod ID/name/huid (index built once, first pod wins)
+        if pods_by_key is None:
+            pods_by_key = {}
+            for pod in all_pods:
+                for key in (pod.id, pod.name, pod.huid):
+                    pods_by_key.setdefault(key, pod)
+        pod = pods_by_key.get(target)
+        if pod:
+            selected.append(pod)
     
     return selected
 
 
+def find_pod(pod_id: str, all_pods: List["PodInfo"]) -> Optional["PodInfo"]:
+    """Find the first pod whose ID, HUID or name matches, in a single pass."""
+    for pod in all_pods:
+        if pod_id in (pod.id, pod.huid, pod.name):
+            return pod
+    return None
+
+
+def fetch_pod(lium: "Lium", pod_id: str) -> Optional["PodInfo"]:
+    """Fetch one pod by ID from the current pod list."""
+    return next((p for p in lium.ps() if p.id == pod_id), None)
+
+
 def wait_ready_no_timeout(lium_client, pod_id: str):
     """Wait indefinitely for pod to be ready (RUNNING with SSH)."""
     import time
     
     while True:
-        fresh_pods = lium_client.ps()
-        pod = next((p for p in fresh_pods if p.id == pod_id), None)
+        pod = fetch_pod(lium_client, pod_id)
         
         if pod and pod.status.upper() == "RUNNING" and pod.ssh_cmd:
             return pod
@@ -621,10 +769,20 @@ def wait_ready_no_timeout(lium_client, pod_id: str):
         time.sleep(10)  # Check every 10 seconds
 
 
+@lru_cache(maxsize=1)
+def get_lium() -> "Lium":
+    """Return the process-wide Lium client.
+
+    Commands that call into each other (e.g. up -> ls) share one client and
+    its HTTP connection pool instead of opening a new one each time.
+    """
+    from lium.sdk import Lium
+    return Lium()
+
+
 def get_pytorch_template_id() -> Optional[str]:
     """Get the template ID for the newest PyTorch template."""
-    
-    lium = Lium()
+    lium = get_lium()
     templates = lium.templates()
 
     if config.default_template_id in {t.id for t in templates}:
@@ -730,7 +888,7 @@ def ensure_backup_params(
     return params
 
 
-def setup_backup(lium, pod: PodInfo, backup_params: BackupParams, replace_existing: bool = True) -> None:
+def setup_backup(lium, pod: "PodInfo", backup_params: BackupParams, replace_existing: bool = True) -> None:
     """Setup backup for a pod using lium SDK.
     
     Args:
@@ -1,10 +1,11 @@
 """Volumes display formatting."""
 
-from typing import List
+from typing import TYPE_CHECKING, List
 from rich.table import Table
 from rich.text import Text
 
-from lium.sdk import VolumeInfo
+if TYPE_CHECKING:
+    from lium.sdk import VolumeInfo
 from lium.cli import ui
 from lium.cli.utils import mid_ellipsize, format_date
 
@@ -31,7 +32,7 @@ def format_file_count(count: int) -> str:
         return f"{count / 1000000:.1f}M"
 
 
-def build_volumes_table(volumes: List[VolumeInfo]) -> tuple[Table, str, str]:
+def build_volumes_table(volumes: List["VolumeInfo"]) -> tuple[Table, str, str]:
     header = f"{Text('Volumes', style='bold')}  ({len(volumes)} total)"
     tip = f"Tip: {ui.styled('lium up <executor> --volume id:<HUID>', 'success')} {ui.styled('# attach volume to pod', 'dim')}"
 
@@ -2,9 +2,8 @@
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config, store_volume_selection
+from lium.cli.utils import handle_errors, ensure_config, store_volume_selection, get_lium
 from ..display import build_volumes_table
 from .actions import GetVolumesAction
 
@@ -15,7 +14,7 @@ def volumes_list_command():
     """List all volumes."""
     ensure_config()
 
-    lium = Lium()
+    lium = get_lium()
     ctx = {"lium": lium}
 
     action = GetVolumesAction()
@@ -3,9 +3,8 @@
 from typing import Optional
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config
+from lium.cli.utils import handle_errors, ensure_config, get_lium
 from .actions import CreateVolumeAction
 
 
@@ -17,7 +16,7 @@ def volumes_new_command(name: str, desc: Optional[str]):
     """Create a new volume."""
     ensure_config()
 
-    lium = Lium()
+    lium = get_lium()
     ctx = {"lium": lium, "name": name, "description": desc or ""}
 
     action = CreateVolumeAction()
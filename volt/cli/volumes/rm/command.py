@@ -2,9 +2,8 @@
 
 import click
 
-from lium.sdk import Lium
 from lium.cli import ui
-from lium.cli.utils import handle_errors, ensure_config, get_last_volume_selection
+from lium.cli.utils import handle_errors, ensure_config, get_last_volume_selection, get_lium
 from . import validation, parsing
 from .actions import RemoveVolumesAction
 
@@ -47,7 +46,7 @@ def volumes_rm_command(indices: str, yes: bool):
             return
 
     # Execute
-    lium = Lium()
+    lium = get_lium()
     ctx = {"lium": lium, "volumes_to_remove": volumes_to_remove, "ui": ui}
 
     action = RemoveVolumesAction()
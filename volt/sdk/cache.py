@@ -0,0 +1,107 @@
+"""On-disk response cache for slow-changing VoltageGPU API listings."""
+
+import hashlib
+import json
+import os
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+CACHE_DIR = Path.home() / ".volt" / "cache"
+
+# Returned by a revalidating method when the server answered 304 Not Modified
+NOT_MODIFIED = object()
+
+
+def _cache_file(client: Any, name: str, args: tuple, kwargs: Dict[str, Any]) -> Path:
+    """Get the cache file for a call, keyed per API URL and API key."""
+    key = repr((client.config.base_url, client.config.api_key, name, args, sorted(kwargs.items())))
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _read(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """Read a cache entry, or None if missing or unreadable."""
+    try:
+        with open(cache_file) as f:
+            entry = json.load(f)
+        return entry if "ts" in entry and "payload" in entry else None
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write(cache_file: Path, payload: Any, etag: Optional[str] = None) -> None:
+    """Write a cache entry atomically, ignoring filesystem errors."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({"ts": time.time(), "payload": payload, "etag": etag}, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _is_outage(error: httpx.HTTPError) -> bool:
+    """Whether a failed request may be answered from a stale entry.
+
+    Only network failures and 5xx responses qualify; 4xx responses such as
+    401/403 mean the cached data can no longer be trusted for this caller.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def cached(ttl: float, revalidate: bool = False) -> Callable:
+    """Cache a client method's JSON payload on disk for ttl seconds.
+
+    The wrapped method must return JSON-serializable data. If the request
+    fails with a network error or a 5xx response, the last cached payload
+    is returned even when it is stale; 4xx errors always propagate.
+    Call ``method.invalidate(client, *args, **kwargs)`` after writes.
+
+    With revalidate, an expired entry is checked with the server instead of
+    refetched: the method gets the cached ``etag`` keyword and returns either
+    ``(payload, etag)`` or ``NOT_MODIFIED`` to keep the cached payload.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache_file = _cache_file(self, func.__name__, args, kwargs)
+            entry = _read(cache_file)
+            if entry and time.time() - entry["ts"] < ttl:
+                return entry["payload"]
+
+            try:
+                if not revalidate:
+                    payload = func(self, *args, **kwargs)
+                    etag = None
+                else:
+                    result = func(self, *args, etag=entry.get("etag") if entry else None, **kwargs)
+                    if result is NOT_MODIFIED:
+                        payload, etag = entry["payload"], entry.get("etag")
+                    else:
+                        payload, etag = result
+            except httpx.HTTPError as e:
+                if entry and _is_outage(e):
+                    return entry["payload"]
+                raise
+
+            _write(cache_file, payload, etag)
+            return payload
+
+        def invalidate(client, *args, **kwargs) -> None:
+            try:
+                _cache_file(client, func.__name__, args, kwargs).unlink()
+            except OSError:
+                pass
+
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
+
+
+__all__ = ["cached", "NOT_MODIFIED"]
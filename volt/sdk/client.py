@@ -1,9 +1,15 @@
 """VoltageGPU SDK Client - Main API client for VoltageGPU."""
 
 import httpx
-from typing import Any, Dict, List, Optional
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from dataclasses import dataclass
 
+from .cache import NOT_MODIFIED, cached
 from .config import Config
 
 
@@ -60,31 +66,201 @@ class Machine:
     location: Optional[str] = None
 
 
+# (field, API keys in order of preference, default) used by the _parse_* methods
+_POD_FIELDS = (
+    ("id", ("id", "podId"), ""),
+    ("name", ("name",), ""),
+    ("status", ("status",), "unknown"),
+    ("gpu_type", ("gpuType", "gpu_type"), ""),
+    ("gpu_count", ("gpuCount", "gpu_count"), 1),
+    ("hourly_price", ("hourlyPrice", "hourly_price"), 0),
+    ("ssh_host", ("sshHost", "ssh_host"), None),
+    ("ssh_port", ("sshPort", "ssh_port"), None),
+    ("template_id", ("templateId", "template_id"), None),
+    ("created_at", ("createdAt", "created_at"), None),
+)
+
+_TEMPLATE_FIELDS = (
+    ("id", ("id", "templateId"), ""),
+    ("name", ("name",), ""),
+    ("description", ("description",), ""),
+    ("docker_image", ("dockerImage", "docker_image"), ""),
+    ("gpu_type", ("gpuType", "gpu_type"), ""),
+    ("min_gpu", ("minGpu", "min_gpu"), 1),
+    ("max_gpu", ("maxGpu", "max_gpu"), 8),
+    ("hourly_price", ("hourlyPrice", "hourly_price"), 0),
+    ("category", ("category",), None),
+)
+
+_SSH_KEY_FIELDS = (
+    ("id", ("id", "keyId"), ""),
+    ("name", ("name",), ""),
+    ("public_key", ("publicKey", "public_key"), ""),
+    ("fingerprint", ("fingerprint",), None),
+    ("created_at", ("createdAt", "created_at"), None),
+)
+
+_MACHINE_FIELDS = (
+    ("id", ("id", "machineId"), ""),
+    ("gpu_type", ("gpuType", "gpu_type"), ""),
+    ("gpu_count", ("gpuCount", "gpu_count"), 1),
+    ("cpu_cores", ("cpuCores", "cpu_cores"), 0),
+    ("ram_gb", ("ramGb", "ram_gb"), 0),
+    ("storage_gb", ("storageGb", "storage_gb"), 0),
+    ("hourly_price", ("hourlyPrice", "hourly_price"), 0),
+    ("available", ("available",), True),
+    ("location", ("location",), None),
+)
+
+
+def _pick_fields(data: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+    """Map API data to field values, taking the first alias present in data."""
+    values = {}
+    for field, keys, default in fields:
+        for key in keys:
+            if key in data:
+                values[field] = data[key]
+                break
+        else:
+            values[field] = default
+    if "hourly_price" in values:
+        values["hourly_price"] = float(values["hourly_price"])
+    return values
+
+
+def _pick_many(records: List[Dict[str, Any]], fields: tuple) -> Iterator[Dict[str, Any]]:
+    """Map a list response to field values, resolving API keys once.
+
+    A response uses one casing throughout, so the keys present in the first
+    record are fetched from every record with a single itemgetter call; only
+    fields missing from it go through the alias search. A record lacking a
+    resolved key, or holding an alias preferred over one, falls back to
+    _pick_fields, so every record maps exactly as _pick_fields maps it.
+    """
+    if not records:
+        return
+    sample = records[0]
+    names, keys, rest, preferred = [], [], [], []
+    for field, aliases, default in fields:
+        key = next((k for k in aliases if k in sample), None)
+        if key is None:
+            rest.append((field, aliases, default))
+        else:
+            names.append(field)
+            keys.append(key)
+            preferred.extend(aliases[:aliases.index(key)])
+    if len(keys) < 2:
+        # itemgetter returns a bare value for one key; not worth specializing
+        for data in records:
+            yield _pick_fields(data, fields)
+        return
+
+    getter = itemgetter(*keys)
+    rest = tuple(rest)
+    preferred = tuple(preferred)
+    for data in records:
+        if preferred and any(key in data for key in preferred):
+            yield _pick_fields(data, fields)
+            continue
+        try:
+            values = dict(zip(names, getter(data)))
+        except KeyError:
+            yield _pick_fields(data, fields)
+            continue
+        if rest:
+            values.update(_pick_fields(data, rest))
+        if "hourly_price" in values:
+            values["hourly_price"] = float(values["hourly_price"])
+        yield values
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class VoltageGPUClient:
     """Main client for interacting with VoltageGPU API."""
 
-    def __init__(self, config: Optional[Config] = None):
-        """Initialize the client with optional config."""
+    def __init__(self, config: Optional[Config] = None, http_client: Optional[httpx.Client] = None):
+        """Initialize the client with optional config.
+
+        Pass http_client to share one connection pool between clients; a
+        shared http_client is not closed by close() or the context manager.
+        """
         self.config = config or Config.load()
-        self._client = httpx.Client(
-            base_url=self.config.base_url,
+        self._owns_client = http_client is None
+        self._client = http_client or self.create_http_client(self.config)
+
+    @staticmethod
+    def create_http_client(config: Config) -> httpx.Client:
+        """Create a pooled HTTP client for the API (HTTP/2 when h2 is installed).
+
+        Idle connections are kept for 30s so polling loops reuse one TLS
+        session.
+        """
+        return httpx.Client(
+            base_url=config.base_url,
             headers={
-                "Authorization": f"Bearer {self.config.api_key}",
+                "Authorization": f"Bearer {config.api_key}",
                 "Content-Type": "application/json",
                 "User-Agent": "VoltageGPU-CLI/0.1.0"
             },
-            timeout=30.0
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            # No explicit transport: httpx only mounts HTTP(S)_PROXY/NO_PROXY
+            # proxies for clients that build their own
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+            )
         )
 
     def __enter__(self):
         return self
 
     def __exit__(self, *args):
-        self._client.close()
+        self.close()
 
     def close(self):
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client, unless it was passed in and is shared."""
+        if self._owns_client:
+            self._client.close()
+
+    def warm_up(self) -> None:
+        """Open a pooled connection in the background so the first real call skips the handshake."""
+        def _head():
+            try:
+                self._client.head("/")
+            except httpx.HTTPError:
+                pass
+
+        threading.Thread(target=_head, daemon=True).start()
+
+    def gather(self, *calls: Callable[[], Any], max_workers: int = 16) -> List[Any]:
+        """Run independent zero-argument calls concurrently, returns results in order.
+
+        All calls share this client's connection pool, so N independent GETs
+        cost about one round-trip instead of N; at most max_workers run at
+        once to stay within API rate limits. The first exception is raised.
+        """
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def _get_revalidated(self, path: str, params: Dict[str, Any], etag: Optional[str]) -> Any:
+        """GET with If-None-Match, returns (payload, etag) or NOT_MODIFIED on 304."""
+        headers = {"If-None-Match": etag} if etag else None
+        response = self._client.get(path, params=params, headers=headers)
+        if response.status_code == 304:
+            return NOT_MODIFIED
+        response.raise_for_status()
+        return orjson.loads(response.content), response.headers.get("ETag")
 
     # ==================== PODS ====================
 
@@ -92,14 +268,19 @@ class VoltageGPUClient:
         """List all pods for the current user."""
         response = self._client.get("/volt/pods")
         response.raise_for_status()
-        data = response.json()
-        return [self._parse_pod(p) for p in data.get("pods", data)]
+        data = orjson.loads(response.content)
+        return [Pod(**values) for values in _pick_many(data.get("pods", data), _POD_FIELDS)]
+
+    def list_pods_detailed(self) -> List[Pod]:
+        """List all pods with full details, fetching each pod concurrently."""
+        pods = self.list_pods()
+        return self.gather(*(partial(self.get_pod, pod.id) for pod in pods))
 
     def get_pod(self, pod_id: str) -> Pod:
         """Get details of a specific pod."""
         response = self._client.get(f"/volt/pods/{pod_id}")
         response.raise_for_status()
-        return self._parse_pod(response.json())
+        return self._parse_pod(orjson.loads(response.content))
 
     def create_pod(
         self,
@@ -123,21 +304,35 @@ class VoltageGPUClient:
         if env_vars:
             payload["envVars"] = env_vars
 
-        response = self._client.post("/volt/pods", json=payload)
+        response = self._client.post("/volt/pods", content=orjson.dumps(payload))
         response.raise_for_status()
-        return self._parse_pod(response.json())
+        return self._parse_pod(orjson.loads(response.content))
+
+    def create_pods(self, specs: List[Dict[str, Any]], max_workers: int = 8) -> List[Union[Pod, Exception]]:
+        """Create several pods concurrently, one create_pod() keyword dict per spec.
+
+        Returns one entry per spec in order: the created Pod, or the exception
+        raised for that spec so one failure does not hide the others.
+        """
+        def create(spec: Dict[str, Any]) -> Union[Pod, Exception]:
+            try:
+                return self.create_pod(**spec)
+            except Exception as e:
+                return e
+
+        return self.gather(*(partial(create, spec) for spec in specs), max_workers=max_workers)
 
     def start_pod(self, pod_id: str) -> Pod:
         """Start a stopped pod."""
         response = self._client.post(f"/volt/pods/{pod_id}/start")
         response.raise_for_status()
-        return self._parse_pod(response.json())
+        return self._parse_pod(orjson.loads(response.content))
 
     def stop_pod(self, pod_id: str) -> Pod:
         """Stop a running pod."""
         response = self._client.post(f"/volt/pods/{pod_id}/stop")
         response.raise_for_status()
-        return self._parse_pod(response.json())
+        return self._parse_pod(orjson.loads(response.content))
 
     def delete_pod(self, pod_id: str) -> bool:
         """Delete a pod."""
@@ -147,110 +342,87 @@ class VoltageGPUClient:
 
     def _parse_pod(self, data: Dict[str, Any]) -> Pod:
         """Parse pod data from API response."""
-        return Pod(
-            id=data.get("id", data.get("podId", "")),
-            name=data.get("name", ""),
-            status=data.get("status", "unknown"),
-            gpu_type=data.get("gpuType", data.get("gpu_type", "")),
-            gpu_count=data.get("gpuCount", data.get("gpu_count", 1)),
-            hourly_price=float(data.get("hourlyPrice", data.get("hourly_price", 0))),
-            ssh_host=data.get("sshHost", data.get("ssh_host")),
-            ssh_port=data.get("sshPort", data.get("ssh_port")),
-            template_id=data.get("templateId", data.get("template_id")),
-            created_at=data.get("createdAt", data.get("created_at"))
-        )
+        values = _pick_fields(data, _POD_FIELDS)
+        return Pod(**values)
 
     # ==================== TEMPLATES ====================
 
     def list_templates(self, category: Optional[str] = None) -> List[Template]:
         """List available templates."""
+        data = self._templates_payload(category)
+        return [Template(**values) for values in _pick_many(data.get("templates", data), _TEMPLATE_FIELDS)]
+
+    @cached(ttl=60, revalidate=True)
+    def _templates_payload(self, category: Optional[str], etag: Optional[str] = None) -> Any:
         params = {}
         if category:
             params["category"] = category
-        response = self._client.get("/volt/templates", params=params)
-        response.raise_for_status()
-        data = response.json()
-        return [self._parse_template(t) for t in data.get("templates", data)]
+        return self._get_revalidated("/volt/templates", params, etag)
 
     def get_template(self, template_id: str) -> Template:
         """Get details of a specific template."""
         response = self._client.get(f"/volt/templates/{template_id}")
         response.raise_for_status()
-        return self._parse_template(response.json())
+        return self._parse_template(orjson.loads(response.content))
 
     def _parse_template(self, data: Dict[str, Any]) -> Template:
         """Parse template data from API response."""
-        return Template(
-            id=data.get("id", data.get("templateId", "")),
-            name=data.get("name", ""),
-            description=data.get("description", ""),
-            docker_image=data.get("dockerImage", data.get("docker_image", "")),
-            gpu_type=data.get("gpuType", data.get("gpu_type", "")),
-            min_gpu=data.get("minGpu", data.get("min_gpu", 1)),
-            max_gpu=data.get("maxGpu", data.get("max_gpu", 8)),
-            hourly_price=float(data.get("hourlyPrice", data.get("hourly_price", 0))),
-            category=data.get("category")
-        )
+        values = _pick_fields(data, _TEMPLATE_FIELDS)
+        return Template(**values)
 
     # ==================== SSH KEYS ====================
 
     def list_ssh_keys(self) -> List[SSHKey]:
         """List all SSH keys for the current user."""
+        data = self._ssh_keys_payload()
+        return [SSHKey(**values) for values in _pick_many(data.get("sshKeys", data.get("keys", data)), _SSH_KEY_FIELDS)]
+
+    @cached(ttl=60)
+    def _ssh_keys_payload(self) -> Any:
         response = self._client.get("/volt/ssh-keys")
         response.raise_for_status()
-        data = response.json()
-        return [self._parse_ssh_key(k) for k in data.get("sshKeys", data.get("keys", data))]
+        return orjson.loads(response.content)
 
     def add_ssh_key(self, name: str, public_key: str) -> SSHKey:
         """Add a new SSH key."""
-        response = self._client.post("/volt/ssh-keys", json={
+        response = self._client.post("/volt/ssh-keys", content=orjson.dumps({
             "name": name,
             "publicKey": public_key
-        })
+        }))
         response.raise_for_status()
-        return self._parse_ssh_key(response.json())
+        self._ssh_keys_payload.invalidate(self)
+        return self._parse_ssh_key(orjson.loads(response.content))
 
     def delete_ssh_key(self, key_id: str) -> bool:
         """Delete an SSH key."""
         response = self._client.delete(f"/volt/ssh-keys/{key_id}")
         response.raise_for_status()
+        self._ssh_keys_payload.invalidate(self)
         return True
 
     def _parse_ssh_key(self, data: Dict[str, Any]) -> SSHKey:
         """Parse SSH key data from API response."""
-        return SSHKey(
-            id=data.get("id", data.get("keyId", "")),
-            name=data.get("name", ""),
-            public_key=data.get("publicKey", data.get("public_key", "")),
-            fingerprint=data.get("fingerprint"),
-            created_at=data.get("createdAt", data.get("created_at"))
-        )
+        values = _pick_fields(data, _SSH_KEY_FIELDS)
+        return SSHKey(**values)
 
     # ==================== MACHINES ====================
 
     def list_machines(self, gpu_type: Optional[str] = None) -> List[Machine]:
         """List available machines."""
+        data = self._machines_payload(gpu_type)
+        return [Machine(**values) for values in _pick_many(data.get("machines", data), _MACHINE_FIELDS)]
+
+    @cached(ttl=10, revalidate=True)
+    def _machines_payload(self, gpu_type: Optional[str], etag: Optional[str] = None) -> Any:
         params = {}
         if gpu_type:
             params["gpuType"] = gpu_type
-        response = self._client.get("/volt/machines", params=params)
-        response.raise_for_status()
-        data = response.json()
-        return [self._parse_machine(m) for m in data.get("machines", data)]
+        return self._get_revalidated("/volt/machines", params, etag)
 
     def _parse_machine(self, data: Dict[str, Any]) -> Machine:
         """Parse machine data from API response."""
-        return Machine(
-            id=data.get("id", data.get("machineId", "")),
-            gpu_type=data.get("gpuType", data.get("gpu_type", "")),
-            gpu_count=data.get("gpuCount", data.get("gpu_count", 1)),
-            cpu_cores=data.get("cpuCores", data.get("cpu_cores", 0)),
-            ram_gb=data.get("ramGb", data.get("ram_gb", 0)),
-            storage_gb=data.get("storageGb", data.get("storage_gb", 0)),
-            hourly_price=float(data.get("hourlyPrice", data.get("hourly_price", 0))),
-            available=data.get("available", True),
-            location=data.get("location")
-        )
+        values = _pick_fields(data, _MACHINE_FIELDS)
+        return Machine(**values)
 
     # ==================== ACCOUNT ====================
 
@@ -258,14 +430,14 @@ class VoltageGPUClient:
         """Get current account balance."""
         response = self._client.get("/user/balance")
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return float(data.get("balance", 0))
 
     def get_account_info(self) -> Dict[str, Any]:
         """Get account information."""
         response = self._client.get("/account")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
 
 __all__ = ["VoltageGPUClient", "Pod", "Template", "SSHKey", "Machine"]
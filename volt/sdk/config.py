@@ -2,8 +2,22 @@
 
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+_ENV_VARS = ("VOLT_API_KEY", "LIUM_API_KEY", "VOLT_BASE_URL", "LIUM_BASE_URL", "VOLT_PAY_URL", "LIUM_PAY_URL")
+
+# Last loaded config with the env values and config file mtime it was built from
+_cache: Optional[Tuple[tuple, "Config"]] = None
+
+
+def _config_file() -> Optional[Path]:
+    """Get the config file in use, VoltageGPU first, then legacy Lium."""
+    for config_file in (Path.home() / ".volt" / "config.ini", Path.home() / ".lium" / "config.ini"):
+        if config_file.exists():
+            return config_file
+    return None
 
 
 @dataclass
@@ -15,16 +29,32 @@ class Config:
 
     @classmethod
     def load(cls) -> "Config":
-        """Load config from env/file with smart defaults."""
+        """Load config from env/file with smart defaults.
+
+        The result is reused until the environment or the config file changes.
+        """
+        global _cache
+        config_file = _config_file()
+        try:
+            mtime = config_file.stat().st_mtime_ns if config_file else None
+        except OSError:
+            mtime = None
+        key = (tuple(os.environ.get(name) for name in _ENV_VARS), config_file, mtime)
+        if _cache is not None and _cache[0] == key:
+            return _cache[1]
+
+        config = cls._load(config_file)
+        _cache = (key, config)
+        return config
+
+    @classmethod
+    def _load(cls, config_file: Optional[Path]) -> "Config":
+        """Build config from env and the given config file."""
         # Support both VOLT_API_KEY and legacy LIUM_API_KEY for compatibility
         api_key = os.getenv("VOLT_API_KEY") or os.getenv("LIUM_API_KEY")
         if not api_key:
             from configparser import ConfigParser
-            # Check VoltageGPU config first, then fallback to legacy
-            config_file = Path.home() / ".volt" / "config.ini"
-            if not config_file.exists():
-                config_file = Path.home() / ".lium" / "config.ini"
-            if config_file.exists():
+            if config_file:
                 config = ConfigParser()
                 config.read(config_file)
                 api_key = config.get("api", "api_key", fallback=None)
@@ -47,9 +77,9 @@ class Config:
             ssh_key_path=ssh_key
         )
 
-    @property
+    @cached_property
     def ssh_public_keys(self) -> List[str]:
-        """Get SSH public keys."""
+        """Get SSH public keys, read once per config."""
         if not self.ssh_key_path:
             return []
         pub_path = self.ssh_key_path.with_suffix('.pub')
@@ -1,17 +1,321 @@
 """Higher-level decorators built on top of the Lium SDK."""
 
+import ast
+import atexit
+import base64
+import hashlib
 import inspect
 import json
 import os
+import pickle
+import queue
 import random
 import shlex
 import tempfile
+import textwrap
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence, Tuple
+
+import orjson
 
 from .client import Lium
 from .exceptions import LiumError
+from .utils import extract_gpu_type
+
+# Seconds to wait for a new pod to become ready
+POD_READY_TIMEOUT = 300
+
+# Seconds an executor listing is reused by @machine calls
+LS_CACHE_TTL = 30.0
+
+# Idle pooled pods older than this are destroyed
+POOL_IDLE_TTL = 600.0
+
+# Seconds between pool top-up and reaping passes
+POOL_CHECK_INTERVAL = 30.0
+
+# Venv snapshots on the pod, one tarball per requirements set
+VENV_CACHE_DIR = "/var/cache/lium/venvs"
+
+# Base64 runner scripts up to this size are passed inline to exec, staying
+# well under Linux's 128 KiB limit for a single command-line argument
+INLINE_SCRIPT_LIMIT = 96 * 1024
+
+# Markers around the JSON result the runner prints on stdout
+RESULT_START = "\n__LIUM_RESULT__"
+RESULT_END = "__LIUM_END__\n"
+
+# Printed on stdout when the venv could not be prepared
+VENV_FAILED = "__LIUM_VENV_FAILED__"
+
+# Clears what a @machine call leaves on a pod before it is reused
+RESET_COMMAND = "rm -rf /tmp/lium_venv_* /tmp/runner.py /tmp/result.json"
+
+_ls_cache = {"expires": 0.0, "executors": [], "index": {}}
+_ls_lock = threading.Lock()
+
+
+def _index_executors(executors) -> dict:
+    """Map lowered machine names and GPU types to the first executor with them."""
+    index = {}
+    for executor in executors:
+        name = executor.machine_name
+        index.setdefault(name.lower(), executor)
+        index.setdefault(extract_gpu_type(name).lower(), executor)
+    return index
+
+
+def _find_executor(sdk: Lium, machine: str):
+    """Find the first executor whose machine name contains machine.
+
+    The executor listing and its index are shared for LS_CACHE_TTL seconds
+    across calls. Machine types missing from the index fall back to a
+    substring scan, whose result is added to the index.
+    """
+    key = machine.lower()
+    with _ls_lock:
+        now = time.monotonic()
+        if now >= _ls_cache["expires"]:
+            executors = sdk.ls()
+            _ls_cache["executors"] = executors
+            _ls_cache["index"] = _index_executors(executors)
+            _ls_cache["expires"] = now + LS_CACHE_TTL
+
+        index = _ls_cache["index"]
+        if key not in index:
+            index[key] = next(
+                (executor for executor in _ls_cache["executors"] if key in executor.machine_name.lower()),
+                None,
+            )
+        return index[key]
+
+
+def _provision(sdk: Lium, machine: str, template_id: Optional[str], name: str):
+    """Create a pod on the first executor matching machine and wait until it is ready."""
+    matching_executor = _find_executor(sdk, machine)
+    if not matching_executor:
+        raise LiumError(f"No executor found matching machine type: {machine}")
+
+    if template_id is None:
+        template = sdk.default_docker_template(matching_executor.id)
+        template_id = template.id if template else None
+
+    try:
+        pod_dict = sdk.up(
+            executor_id=matching_executor.id,
+            name=name,
+            template_id=template_id,
+        )
+    except Exception:
+        # The cached executor may have been taken meanwhile; refetch next time
+        with _ls_lock:
+            _ls_cache["expires"] = 0.0
+        raise
+
+    pod_info = sdk.wait_ready(pod_dict, timeout=POD_READY_TIMEOUT)
+    if not pod_info:
+        raise LiumError(f"Pod {name} failed to start within {POD_READY_TIMEOUT}s")
+    return pod_info
+
+
+def _function_source(func) -> str:
+    """Return the source of func without its decorators, dedented to column 0.
+
+    The function's AST node marks where the def line starts, which holds for
+    multiline decorators and for 'def ' appearing inside decorator arguments.
+    """
+    source = textwrap.dedent(inspect.getsource(func))
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            lines = source.splitlines(keepends=True)
+            return ''.join(lines[node.lineno - 1:node.end_lineno])
+    raise LiumError(f"Could not find the definition of {func.__name__} in its source")
+
+
+def _upload_runner(sdk: Lium, pod_info, script: bytes) -> None:
+    """Upload the runner script to /tmp/runner.py through a local temp file."""
+    with tempfile.NamedTemporaryFile(suffix='.py', delete=False) as f:
+        f.write(script)
+    try:
+        sdk.upload(pod_info, local=f.name, remote='/tmp/runner.py')
+    finally:
+        os.unlink(f.name)
+
+
+def _parse_result(stdout: str) -> Optional[dict]:
+    """Extract the runner's JSON result from its stdout, or None if missing."""
+    start = stdout.rfind(RESULT_START)
+    if start < 0:
+        return None
+    end = stdout.find(RESULT_END, start)
+    raw = stdout[start + len(RESULT_START):end if end >= 0 else None]
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        pass
+    # The runner reports through stdlib json, which keeps NaN/Infinity values
+    # that orjson refuses to parse
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _venv_command(venv_path: str, reqs: Sequence[str]) -> str:
+    """Build one shell command that creates a venv at venv_path with reqs installed.
+
+    With requirements, the built venv is snapshotted to a tarball on the pod
+    keyed by the sorted requirements, and later calls extract it instead of
+    running pip again.
+    """
+    venv = shlex.quote(venv_path)
+    create = f"python3 -m venv {venv}"
+    if not reqs:
+        return create
+
+    packages = " ".join(shlex.quote(req) for req in reqs)
+    req_hash = hashlib.sha256("\n".join(sorted(reqs)).encode()).hexdigest()[:16]
+    snapshot = shlex.quote(f"{VENV_CACHE_DIR}/{req_hash}.tar")
+    # Snapshotting is best-effort: a read-only cache dir or a full disk must
+    # not fail an install that succeeded
+    save = f"mkdir -p {VENV_CACHE_DIR} && tar -cf {snapshot}.$$ -C {venv} . && mv {snapshot}.$$ {snapshot}"
+    build = (
+        f"{create} && {venv}/bin/python -m pip install {packages}"
+        f" && {{ {save} || rm -f {snapshot}.$$; true; }}"
+    )
+    return f"if [ -f {snapshot} ]; then mkdir -p {venv} && tar -xf {snapshot} -C {venv}; else {build}; fi"
+
+
+class PodPool:
+    """Ready pods kept per (machine, template_id) so @machine calls skip provisioning.
+
+    Pods come back through release() once their remote state is reset. A
+    daemon thread keeps min_idle pods ready for every key acquired so far and
+    destroys pods idle longer than idle_ttl; all idle pods are destroyed at exit.
+    """
+
+    def __init__(self, min_idle: int = 0, idle_ttl: float = POOL_IDLE_TTL, interval: float = POOL_CHECK_INTERVAL):
+        self.min_idle = min_idle
+        self.idle_ttl = idle_ttl
+        self.interval = interval
+        self._idle: Dict[Tuple[str, Optional[str]], queue.Queue] = {}
+        self._lock = threading.Lock()
+        self._sdk: Optional[Lium] = None
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def acquire(self, machine: str, template_id: Optional[str] = None, name: Optional[str] = None):
+        """Take a ready pod for machine, creating one when none is idle."""
+        idle = self._queue((machine, template_id))
+        while True:
+            try:
+                released_at, pod_info = idle.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - released_at < self.idle_ttl:
+                return pod_info
+            self._destroy(pod_info)
+
+        return _provision(self._get_sdk(), machine, template_id, name or f"remote-pool-{int(time.time())}")
+
+    def release(self, pod_info, machine: str, template_id: Optional[str] = None) -> None:
+        """Reset a pod and return it to the pool, destroying it if the reset fails."""
+        try:
+            reset_ok = self._get_sdk().exec(pod_info, command=RESET_COMMAND)['success']
+        except Exception:
+            reset_ok = False
+
+        if not reset_ok or self._closed:
+            self._destroy(pod_info)
+            return
+        self._queue((machine, template_id)).put((time.monotonic(), pod_info))
+
+    def close(self) -> None:
+        """Destroy all idle pods and stop topping the pool up."""
+        self._closed = True
+        for idle in list(self._idle.values()):
+            while True:
+                try:
+                    _, pod_info = idle.get_nowait()
+                except queue.Empty:
+                    break
+                self._destroy(pod_info)
+
+    def _get_sdk(self) -> Lium:
+        with self._lock:
+            if self._sdk is None:
+                self._sdk = Lium()
+            return self._sdk
+
+    def _queue(self, key: Tuple[str, Optional[str]]) -> queue.Queue:
+        """Get the idle queue for a key, starting the maintenance thread on first use."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle is None:
+                idle = self._idle[key] = queue.Queue()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._maintain, name="lium-pod-pool", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+            return idle
+
+    def _destroy(self, pod_info) -> None:
+        try:
+            self._get_sdk().down(pod_info)
+        except Exception:
+            pass  # Best effort cleanup
+
+    def _maintain(self) -> None:
+        """Reap expired idle pods and top each key up to min_idle."""
+        while not self._closed:
+            time.sleep(self.interval)
+            for key, idle in list(self._idle.items()):
+                self._reap(idle)
+                for _ in range(self.min_idle - idle.qsize()):
+                    if self._closed:
+                        return
+                    try:
+                        pod_info = _provision(self._get_sdk(), *key, f"remote-pool-{int(time.time())}")
+                    except Exception:
+                        break
+                    if self._closed:
+                        self._destroy(pod_info)
+                        return
+                    idle.put((time.monotonic(), pod_info))
+
+    def _reap(self, idle: queue.Queue) -> None:
+        """Destroy pods in idle that have outlived idle_ttl."""
+        keep = []
+        while True:
+            try:
+                item = idle.get_nowait()
+            except queue.Empty:
+                break
+            if time.monotonic() - item[0] < self.idle_ttl:
+                keep.append(item)
+            else:
+                self._destroy(item[1])
+        for item in keep:
+            idle.put(item)
+
+
+# Shared pool used by @machine
+pool = PodPool()
+
+# Pod teardown runs off the caller's thread; pending work finishes before exit
+_cleanup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lium-cleanup")
+atexit.register(_cleanup_pool.shutdown, wait=True)
+
+
+def _best_effort(fn, *args, **kwargs) -> None:
+    """Run a cleanup call, ignoring any failure."""
+    try:
+        fn(*args, **kwargs)
+    except Exception:
+        pass
 
 
 def machine(
@@ -19,182 +323,171 @@ def machine(
     template_id: Optional[str] = None,
     cleanup: bool = True,
     requirements: Optional[Sequence[str]] = None,
+    destroy: bool = True,
 ):
     """Decorator to execute a function on a remote Lium machine.
 
-    Creates a new pod, sends function source code and executes it remotely,
-    returns the result, and optionally cleans up the pod.
+    Takes a ready pod from the shared pool (creating one if none is idle),
+    sends function source code and executes it remotely, returns the result,
+    and optionally cleans up the pod.
 
     Args:
         machine: Machine type (e.g., "1xH200", "1xA100")
         template_id: Docker template ID (optional, uses default if not specified)
-        cleanup: Whether to delete the pod after execution (default: True)
+        cleanup: Whether to clean up the pod after execution (default: True)
         requirements: Optional iterable of pip-installable packages to install on the pod
+        destroy: On cleanup, delete the pod (default: True); when False the pod
+            is reset and returned to the pool for the next call
     """
 
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Initialize SDK
-            sdk = Lium()
-            pod_info = None
-
-            try:
-                # Step 1: Find executor matching machine type
-                executors = sdk.ls()
-                matching_executor = None
-                for executor in executors:
-                    if machine.lower() in executor.machine_name.lower():
-                        matching_executor = executor
-                        break
-
-                if not matching_executor:
-                    raise LiumError(f"No executor found matching machine type: {machine}")
-
-                # Step 2: Create pod
-                pod_name = f"remote-{func.__name__}-{int(time.time())}"
-
-                template = sdk.default_docker_template(matching_executor.id)
-
-                pod_dict = sdk.up(
-                    executor_id=matching_executor.id,
-                    name=pod_name,
-                    template_id=template.id if template else None,
-                )
-
-                # Wait for pod to be ready
-                max_wait = 300
-                pod_info = sdk.wait_ready(pod_dict, timeout=max_wait)
-                if not pod_info:
-                    raise LiumError(f"Pod {pod_name} failed to start within {max_wait}s")
-
-                # Step 3: Extract function source code without decorators
-                func_source = inspect.getsource(func)
-                func_name = func.__name__
-
-                # Strip decorator lines - find the 'def' line and keep from there
-                lines = func_source.split('\n')
-                def_index = next(i for i, line in enumerate(lines) if 'def ' in line)
-                func_source = '\n'.join(lines[def_index:])
-
-                # Step 4: Create runner script with function source and arguments
-                runner_script = f'''#!/usr/bin/env python3
+        # Step 3: Extract function source code without decorators, once
+        func_source = _function_source(func)
+        func_name = func.__name__
+
+        # Step 4: Build the runner script around the function source once; each
+        # call only adds its pickled arguments and the result comes back as JSON
+        # between markers on stdout. The head is padded to a multiple of 3 bytes
+        # so its base64 encoding can be reused as a prefix of the full script's
+        script_head = f'''#!/usr/bin/env python3
+import base64
+import json
+import pickle
 import sys
 import traceback
-import json
 
 # Function source code
 {func_source}
 
-try:
-    # Arguments
-    args = {repr(args)}
-    kwargs = {repr(kwargs)}
-
+'''
+        script_head += '\n' * (-len(script_head.encode()) % 3)
+        encoded_head = base64.b64encode(script_head.encode()).decode()
+        script_tail = f'''
     # Execute function
     result = {func_name}(*args, **kwargs)
 
-    # Save result as JSON
-    with open('/tmp/result.json', 'w') as f:
-        json.dump({{'success': True, 'result': result}}, f)
+    # Report result as JSON
+    output = json.dumps({{'success': True, 'result': result}})
+    success = True
 
 except Exception as e:
-    # Save error
-    with open('/tmp/result.json', 'w') as f:
-        json.dump({{
-            'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }}, f)
-    sys.exit(1)
+    # Report error
+    output = json.dumps({{
+        'success': False,
+        'error': str(e),
+        'traceback': traceback.format_exc()
+    }})
+    success = False
+
+sys.stdout.write({RESULT_START!r} + output + {RESULT_END!r})
+sys.exit(0 if success else 1)
 '''
 
-                # Write runner script to temp file
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                    runner_file = f.name
-                    f.write(runner_script)
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # Initialize SDK
+            sdk = Lium()
+            pod_info = None
 
-                try:
-                    # Step 5: Upload runner script
-                    sdk.upload(pod_info, local=runner_file, remote='/tmp/runner.py')
-
-                    # Step 6: Create isolated virtual environment
-                    venv_path = f"/tmp/lium_venv_{int(time.time())}_{random.randint(1000,9999)}"
-                    venv_python = f"{venv_path}/bin/python"
-                    venv_cmd = f"python3 -m venv {shlex.quote(venv_path)}"
-                    venv_result = sdk.exec(pod_info, command=venv_cmd)
-                    if not venv_result['success']:
-                        raise LiumError(f"Failed to create virtual environment:\n{venv_result['stderr']}")
-
-                    # Step 7: Install requirements if requested
-                    reqs = [req for req in (requirements or []) if req]
-                    if reqs:
-                        packages = " ".join(shlex.quote(req) for req in reqs)
-                        install_cmd = f"{shlex.quote(venv_python)} -m pip install {packages}"
-                        install_result = sdk.exec(pod_info, command=install_cmd)
-                        if not install_result['success']:
-                            raise LiumError(
-                                "Failed installing requirements "
-                                f"({', '.join(reqs)}):\n{install_result['stderr']}"
-                            )
-
-                    # Step 8: Execute runner via virtual environment python
-                    exec_result = sdk.exec(
-                        pod_info,
-                        command=f"{shlex.quote(venv_python)} /tmp/runner.py"
+            # Steps 1-2: Take a ready pod from the pool, or create one, in the
+            # background while the runner script is prepared locally
+            provisioner = ThreadPoolExecutor(max_workers=1)
+            pod_future = provisioner.submit(
+                pool.acquire, machine, template_id, name=f"remote-{func.__name__}-{int(time.time())}"
+            )
+            provisioner.shutdown(wait=False)
+
+            try:
+                # Step 4: Only the pickled arguments change between calls
+                payload = base64.b64encode(pickle.dumps((args, kwargs), protocol=4)).decode()
+                call_script = (
+                    "try:\n"
+                    "    # Arguments\n"
+                    f"    args, kwargs = pickle.loads(base64.b64decode({payload!r}))\n"
+                    f"{script_tail}"
+                )
+
+                # Small scripts travel inline in the exec command; larger ones
+                # would exceed the kernel's per-argument limit and are uploaded
+                encoded_script = encoded_head + base64.b64encode(call_script.encode()).decode()
+
+                pod_info = pod_future.result()
+
+                # Step 5: Upload runner script when it is too large to inline
+                upload = len(encoded_script) > INLINE_SCRIPT_LIMIT
+                if upload:
+                    _upload_runner(sdk, pod_info, (script_head + call_script).encode())
+
+                # Steps 6-8: Set up the virtual environment (restoring a cached
+                # snapshot for the same requirements) and run, in one exec
+                venv_path = f"/tmp/lium_venv_{int(time.time())}_{random.randint(1000,9999)}"
+                venv_python = shlex.quote(f"{venv_path}/bin/python")
+                reqs = [req for req in (requirements or []) if req]
+                if upload:
+                    run_cmd = f"{venv_python} /tmp/runner.py"
+                else:
+                    bootstrap = f"import base64; exec(compile(base64.b64decode('{encoded_script}'), 'runner.py', 'exec'))"
+                    run_cmd = f"{venv_python} -c {shlex.quote(bootstrap)}"
+                exec_result = sdk.exec(
+                    pod_info,
+                    command=(
+                        f"{{ {_venv_command(venv_path, reqs)}; }} >&2"
+                        f" || {{ echo {VENV_FAILED}; exit 1; }}; {run_cmd}"
                     )
+                )
 
-                    # Step 9: Download result (even when execution failed to capture error details)
-                    result_data = None
-                    result_file = None
-                    try:
-                        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-                            result_file = f.name
-                        sdk.download(pod_info, remote='/tmp/result.json', local=result_file)
-                        with open(result_file, 'r') as f:
-                            result_data = json.load(f)
-                    except Exception:
-                        result_data = None
-                    finally:
-                        if result_file and os.path.exists(result_file):
-                            os.unlink(result_file)
+                stdout = exec_result.get('stdout') or ''
+                if VENV_FAILED in stdout:
+                    if reqs:
+                        raise LiumError(
+                            "Failed installing requirements "
+                            f"({', '.join(reqs)}):\n{exec_result.get('stderr')}"
+                        )
+                    raise LiumError(f"Failed to create virtual environment:\n{exec_result.get('stderr')}")
 
-                    if result_data and result_data.get('success'):
-                        return result_data['result']
+                # Step 9: Read the result from stdout (present even when execution failed)
+                result_data = _parse_result(stdout)
 
-                    # Construct detailed error message
-                    if result_data and not result_data.get('success', True):
-                        err_msg = result_data.get('error', 'Unknown remote error')
-                        tb = result_data.get('traceback')
-                        if tb:
-                            err_msg = f"{err_msg}\n\nTraceback:\n{tb}"
-                        raise LiumError(f"Remote execution failed:\n{err_msg}")
+                if result_data and result_data.get('success'):
+                    return result_data['result']
 
-                    stderr = exec_result.get('stderr') or exec_result.get('stdout') or 'Unknown remote error'
-                    raise LiumError(f"Remote execution failed:\n{stderr}")
+                # Construct detailed error message
+                if result_data and not result_data.get('success', True):
+                    err_msg = result_data.get('error', 'Unknown remote error')
+                    tb = result_data.get('traceback')
+                    if tb:
+                        err_msg = f"{err_msg}\n\nTraceback:\n{tb}"
+                    raise LiumError(f"Remote execution failed:\n{err_msg}")
 
-                finally:
-                    # Clean up local temp file
-                    os.unlink(runner_file)
+                stderr = exec_result.get('stderr') or exec_result.get('stdout') or 'Unknown remote error'
+                raise LiumError(f"Remote execution failed:\n{stderr}")
 
             finally:
-                # Remove virtual environment directory best-effort when pod stays alive
-                if pod_info and 'venv_path' in locals():
+                # A local step failed before the pod was needed; still collect it for cleanup
+                if pod_info is None:
                     try:
-                        sdk.exec(pod_info, command=f"rm -rf {shlex.quote(venv_path)}")
+                        pod_info = pod_future.result()
                     except Exception:
                         pass
 
-                # Step 10: Cleanup pod
+                # Step 10: Cleanup pod in a single call, in the background so the
+                # result is returned right away. A destroyed pod takes its files
+                # with it and a pooled pod is reset on release, so only a pod left
+                # running needs the venv and runner removed
                 if cleanup and pod_info:
-                    try:
-                        sdk.down(pod_info)
-                    except Exception:
-                        pass  # Best effort cleanup
+                    if destroy:
+                        _cleanup_pool.submit(_best_effort, sdk.down, pod_info)
+                    else:
+                        _cleanup_pool.submit(pool.release, pod_info, machine, template_id)
+                elif pod_info and 'venv_path' in locals():
+                    _cleanup_pool.submit(
+                        _best_effort, sdk.exec, pod_info,
+                        command=f"rm -rf {shlex.quote(venv_path)} /tmp/runner.py",
+                    )
 
         return wrapper
 
     return decorator
 
 
-__all__ = ["machine"]
+__all__ = ["machine", "PodPool", "pool"]
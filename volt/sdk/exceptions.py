@@ -1,5 +1,8 @@
 """Exception hierarchy for the Lium SDK."""
 
+from typing import Optional
+
+
 class LiumError(Exception):
     """Base exception for Lium SDK."""
 
@@ -9,7 +12,14 @@ class LiumAuthError(LiumError):
 
 
 class LiumRateLimitError(LiumError):
-    """Rate limit exceeded."""
+    """Rate limit exceeded.
+
+    retry_after carries the server's Retry-After value in seconds, when sent.
+    """
+
+    def __init__(self, *args, retry_after: Optional[float] = None):
+        super().__init__(*args)
+        self.retry_after = retry_after
 
 
 class LiumServerError(LiumError):
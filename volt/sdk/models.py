@@ -4,6 +4,11 @@ from dataclasses import dataclass
 import re
 from typing import Dict, List, Optional
 
+# Parts of a pod's "ssh user@host -p PORT" command
+_HOST_RE = re.compile(r'@(\S+)')
+_USER_RE = re.compile(r'ssh (\S+)@')
+_PORT_RE = re.compile(r'-p \s*(\S+)')
+
 
 @dataclass
 class ExecutorInfo:
@@ -51,18 +56,19 @@ class PodInfo:
 
     @property
     def host(self) -> Optional[str]:
-        return (re.findall(r'@(\S+)', self.ssh_cmd) or [None])[0] if self.ssh_cmd else None
+        match = _HOST_RE.search(self.ssh_cmd) if self.ssh_cmd else None
+        return match.group(1) if match else None
 
     @property
     def username(self) -> Optional[str]:
-        return (re.findall(r'ssh (\S+)@', self.ssh_cmd) or [None])[0] if self.ssh_cmd else None
+        match = _USER_RE.search(self.ssh_cmd) if self.ssh_cmd else None
+        return match.group(1) if match else None
 
     @property
     def ssh_port(self) -> int:
         """Extract SSH port from command."""
-        if not self.ssh_cmd or '-p ' not in self.ssh_cmd:
-            return 22
-        return int(self.ssh_cmd.split('-p ')[1].split()[0])
+        match = _PORT_RE.search(self.ssh_cmd) if self.ssh_cmd else None
+        return int(match.group(1)) if match else 22
 
 
 @dataclass
@@ -4,8 +4,8 @@ import hashlib
 import random
 import re
 import time
-from functools import wraps
-from typing import Callable, TypeVar
+from functools import lru_cache, wraps
+from typing import Callable, List, Optional, Sequence, TypeVar
 
 import requests
 
@@ -17,27 +17,68 @@ F = TypeVar("F", bound=Callable[..., object])
 ADJECTIVES = ["swift", "brave", "calm", "eager", "gentle", "cosmic", "golden", "lunar", "zesty", "noble"]
 NOUNS = ["hawk", "lion", "eagle", "fox", "wolf", "shark", "raven", "matrix", "comet", "orbit"]
 
+# Smallest listing generate_huids hands to numpy
+_NUMPY_HUID_MIN = 64
 
+
+@lru_cache(maxsize=4096)
 def generate_huid(id_str: str) -> str:
     """Generate human-readable ID from UUID."""
     if not id_str:
         return "invalid"
 
-    digest = hashlib.md5(id_str.encode()).hexdigest()
-    adj = ADJECTIVES[int(digest[:4], 16) % len(ADJECTIVES)]
-    noun = NOUNS[int(digest[4:8], 16) % len(NOUNS)]
-    return f"{adj}-{noun}-{digest[-2:]}"
+    # HUIDs are shown to and typed by users, so they must stay stable: keep
+    # MD5 but index its raw bytes instead of parsing hex slices
+    digest = hashlib.md5(id_str.encode()).digest()
+    adj = ADJECTIVES[(digest[0] << 8 | digest[1]) % len(ADJECTIVES)]
+    noun = NOUNS[(digest[2] << 8 | digest[3]) % len(NOUNS)]
+    return f"{adj}-{noun}-{digest[-1]:02x}"
 
 
-def extract_gpu_type(machine_name: str) -> str:
-    """Extract GPU type from machine name."""
-    patterns = [
-        (r"RTX\s*(\d{4})", lambda m: f"RTX{m.group(1)}"),
-        (r"([HBL])(\d{2,3}S?)", lambda m: f"{m.group(1)}{m.group(2)}"),
-        (r"A(\d{2,4})", lambda m: f"A{m.group(1)}"),
+def generate_huids(ids: Sequence[str]) -> List[str]:
+    """Generate HUIDs for many IDs at once, matching generate_huid per ID.
+
+    Listings with at least _NUMPY_HUID_MIN IDs derive the word indices for
+    all digests in one vectorized pass when numpy (the fast extra) is
+    installed; otherwise each ID goes through generate_huid.
+    """
+    if len(ids) < _NUMPY_HUID_MIN:
+        return [generate_huid(id_str) for id_str in ids]
+    try:
+        import numpy as np
+    except ImportError:
+        return [generate_huid(id_str) for id_str in ids]
+
+    md5 = hashlib.md5
+    raw = b"".join(md5(id_str.encode()).digest() for id_str in ids)
+    digests = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 16).astype(np.uint16)
+    adj_idx = ((digests[:, 0] << 8) | digests[:, 1]) % len(ADJECTIVES)
+    noun_idx = ((digests[:, 2] << 8) | digests[:, 3]) % len(NOUNS)
+    return [
+        f"{ADJECTIVES[adj]}-{NOUNS[noun]}-{tail:02x}" if id_str else "invalid"
+        for id_str, adj, noun, tail in zip(ids, adj_idx.tolist(), noun_idx.tolist(), digests[:, 15].tolist())
     ]
-    for pattern, fmt in patterns:
-        if match := re.search(pattern, machine_name, re.I):
+
+
+# GPU type patterns tried in order by extract_gpu_type, with their formatters
+_GPU_PATTERNS = (
+    (re.compile(r"RTX\s*(\d{4})", re.I), lambda m: f"RTX{m.group(1)}"),
+    (re.compile(r"([HBL])(\d{2,3}S?)", re.I), lambda m: f"{m.group(1)}{m.group(2)}"),
+    (re.compile(r"A(\d{2,4})", re.I), lambda m: f"A{m.group(1)}"),
+)
+
+# Shorthand like RTX4090 that expand_gpu_shorthand splits into "RTX 4090"
+_RTX_SHORT_RE = re.compile(r"RTX(\d+)")
+
+
+@lru_cache(maxsize=1024)
+def extract_gpu_type(machine_name: str) -> str:
+    """Extract GPU type from machine name.
+
+    Executor listings repeat a handful of machine names, so results are cached.
+    """
+    for pattern, fmt in _GPU_PATTERNS:
+        if match := pattern.search(machine_name):
             return fmt(match)
     return machine_name.split()[-1] if machine_name else "Unknown"
 
@@ -65,7 +106,7 @@ def expand_gpu_shorthand(gpu_short: str) -> str:
     # Handle RTX cards - need to add space between RTX and number
     if gpu_upper.startswith("RTX"):
         # RTX4090 -> RTX 4090
-        match = re.match(r"RTX(\d+)", gpu_upper)
+        match = _RTX_SHORT_RE.match(gpu_upper)
         if match:
             return f"RTX {match.group(1)}"
 
@@ -75,20 +116,51 @@ def expand_gpu_shorthand(gpu_short: str) -> str:
     return gpu_short
 
 
-def with_retry(max_attempts: int = 3, delay: float = 1.0):
-    """Retry decorator for API calls."""
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide HTTP session for Lium API calls.
+
+    Keeping one pooled session lets sequential and retried calls reuse warm
+    TCP/TLS connections; retries are left to with_retry. Callers must not
+    close it.
+    """
+    global _session
+    if _session is None:
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
+def with_retry(max_attempts: int = 3, delay: float = 1.0, max_delay: float = 30.0):
+    """Retry decorator for API calls.
+
+    Waits use decorrelated jitter between delay and max_delay, and never
+    less than a rate limit's Retry-After.
+    """
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args, **kwargs):
+            sleep = delay
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
-                except (LiumRateLimitError, LiumServerError, requests.RequestException):
+                except (LiumRateLimitError, LiumServerError, requests.RequestException) as e:
                     if attempt == max_attempts - 1:
                         raise
-                    time.sleep(delay * (2 ** attempt) + random.uniform(0, 0.5))
+                    sleep = min(max_delay, random.uniform(delay, sleep * 3))
+                    retry_after = getattr(e, "retry_after", None)
+                    if retry_after:
+                        sleep = max(sleep, float(retry_after))
+                    time.sleep(sleep)
         return wrapper  # type: ignore[misc]
     return decorator
 
 
-__all__ = ["generate_huid", "extract_gpu_type", "expand_gpu_shorthand", "with_retry"]
+__all__ = ["generate_huid", "generate_huids", "extract_gpu_type", "expand_gpu_shorthand", "get_session", "with_retry"]